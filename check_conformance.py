@@ -1,480 +1,652 @@
-#!/usr/bin/env python3
-"""
-Strict namespace-aware ISO 19139 conformance checker.
-
-Processes all ISO19139 .xml files exported from ArcGIS Pro or ArcGIS Online in a 
-given folder. For each file with root gmd:MD_Metadata (proper ISO 19139 namespacing),
-produces an Excel report showing how it satisfies obligatory (mandatory), optional,
-and conditional elements per ISO 19139 / INSPIRE (Regulation 1205/2008). Uses the
-official gmd/gco namespaces so that only properly namespaced ISO 19139 content is
-recognised.
-
-Progress and errors for each file are printed to the console during the run.
-
-Expects XML with root gmd:MD_Metadata (proper ISO 19139 namespacing). Files in
-ArcGIS internal format are skipped. Aligned with INSPIRE Regulation 1205/2008 for
-mandatory/optional/conditional classification.
-
-The script is provided as part of the LandIS Soil Portal project, but can be used with 
-any ISO 19139 metadata files that are properly namespaced.
-
-Stephen Hallett, Cranfield University, 2026
-
-Usage:
-    python check_conformance.py [folder]
-    Default folder: xml. Output: conformance_report_<foldername>.xlsx
-"""
-
-import argparse
-import xml.etree.ElementTree as ET
-from pathlib import Path
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
-
-# ISO 19139 namespace URIs (ISO/TC 211)
-GMD = "http://www.isotc211.org/2005/gmd"
-GCO = "http://www.isotc211.org/2005/gco"
-
-
-def _tag(ns, local):
-    """Return Clark-notation tag for ElementTree find()."""
-    return "{%s}%s" % (ns, local)
-
-
-def _find(root, path):
-    """
-    Find an element by a path of (namespace_uri, local_name) pairs.
-    Returns the element or None if any step fails.
-    """
-    for ns, local in path:
-        if root is None:
-            return None
-        root = root.find(_tag(ns, local))
-    return root
-
-
-def _find_any(root, paths):
-    """
-    Try each path (list of (ns, local) steps); return first non-None element.
-    """
-    for path in paths:
-        el = _find(root, path)
-        if el is not None:
-            return el
-    return None
-
-
-def _get_text(element):
-    """
-    Collect all text content from an element and its descendants (e.g. from
-    gco:CharacterString, gco:Date, or code list elements). Returns stripped
-    string; empty string if element is None or has no text.
-    """
-    if element is None:
-        return ""
-    parts = []
-    if element.text:
-        parts.append(element.text)
-    for child in element:
-        parts.append(_get_text(child))
-        if child.tail:
-            parts.append(child.tail)
-    return " ".join(parts).strip()
-
-
-def _has_value(element):
-    """Return True if element exists and has non-empty text content."""
-    return bool(_get_text(element)) if element is not None else False
-
-
-# Conformance checks: (display_name, obligation, finder_callable).
-# Finder receives root and returns one of: "Present", "Empty", "Absent".
-# We build a list of (name, obligation, finder) where finder(root) -> str.
-
-def _check_single(paths, root):
-    """One or more paths (each path is list of (ns, local)); if any leads to element with content, Present; else Empty or Absent."""
-    el = _find_any(root, paths)
-    if el is None:
-        return "Absent"
-    return "Present" if _has_value(el) else "Empty"
-
-
-def _check_bbox(root):
-    """All four geographic bounding box elements must exist and have content."""
-    base = [
-        (GMD, "identificationInfo"),
-        (GMD, "MD_DataIdentification"),
-        (GMD, "extent"),
-        (GMD, "EX_Extent"),
-        (GMD, "geographicElement"),
-        (GMD, "EX_GeographicBoundingBox"),
-    ]
-    for comp in ["westBoundLongitude", "eastBoundLongitude", "southBoundLatitude", "northBoundLatitude"]:
-        el = _find(root, base + [(GMD, comp)])
-        if el is None or not _has_value(el):
-            return "Absent" if el is None else "Empty"
-    return "Present"
-
-
-def _check_keywords(root):
-    """At least one keyword with content under descriptiveKeywords."""
-    id_info = _find(root, [(GMD, "identificationInfo"), (GMD, "MD_DataIdentification")])
-    if id_info is None:
-        return "Absent"
-    # Can have multiple descriptiveKeywords; each can have multiple keyword
-    for kw_cont in id_info.findall(".//%s" % _tag(GMD, "descriptiveKeywords")):
-        for kw in kw_cont.findall(".//%s" % _tag(GMD, "keyword")):
-            if _has_value(kw):
-                return "Present"
-    return "Empty"
-
-
-def _check_use_limitation(root):
-    """useLimitation can appear in MD_Constraints or MD_LegalConstraints."""
-    id_info = _find(root, [(GMD, "identificationInfo"), (GMD, "MD_DataIdentification")])
-    if id_info is None:
-        return "Absent"
-    for use_lim in id_info.findall(".//%s" % _tag(GMD, "useLimitation")):
-        if _has_value(use_lim):
-            return "Present"
-    return "Empty" if id_info.find(".//%s" % _tag(GMD, "useLimitation")) is not None else "Absent"
-
-
-def _check_access_constraints(root):
-    """accessConstraints in MD_LegalConstraints or RestrictCd in MD_Constraints."""
-    id_info = _find(root, [(GMD, "identificationInfo"), (GMD, "MD_DataIdentification")])
-    if id_info is None:
-        return "Absent"
-    # MD_LegalConstraints/accessConstraints
-    ac = id_info.find(".//%s/%s" % (_tag(GMD, "MD_LegalConstraints"), _tag(GMD, "accessConstraints")))
-    if ac is not None and _has_value(ac):
-        return "Present"
-    # Or RestrictCd under accessConsts (some profiles)
-    restrict = id_info.find(".//%s" % _tag(GMD, "accessConstraints"))
-    if restrict is not None and _has_value(restrict):
-        return "Present"
-    return "Empty" if (ac is not None or restrict is not None) else "Absent"
-
-
-def _check_other_constraints(root):
-    id_info = _find(root, [(GMD, "identificationInfo"), (GMD, "MD_DataIdentification")])
-    if id_info is None:
-        return "Absent"
-    other = id_info.find(".//%s" % _tag(GMD, "otherConstraints"))
-    if other is None:
-        return "Absent"
-    return "Present" if _has_value(other) else "Empty"
-
-
-def _check_distribution_linkage(root):
-    """Distribution: onLine/CI_OnlineResource/linkage (URL or CharacterString)."""
-    dist = _find(root, [(GMD, "distributionInfo"), (GMD, "MD_Distribution")])
-    if dist is None:
-        return "Absent"
-    for on_line in dist.findall(".//%s" % _tag(GMD, "onLine")):
-        res = on_line.find(_tag(GMD, "CI_OnlineResource"))
-        if res is None:
-            continue
-        linkage = res.find(_tag(GMD, "linkage"))
-        if linkage is not None and _has_value(linkage):
-            return "Present"
-    return "Empty" if dist.find(".//%s" % _tag(GMD, "linkage")) is not None else "Absent"
-
-
-def _check_conformance_spec_and_pass(root):
-    """Conformance: specification title and pass in DQ_ConformanceResult."""
-    dq = _find(root, [(GMD, "dataQualityInfo"), (GMD, "DQ_DataQuality")])
-    if dq is None:
-        return "Absent"
-    result = dq.find(".//%s" % _tag(GMD, "DQ_ConformanceResult"))
-    if result is None:
-        return "Absent"
-    spec = result.find(".//%s/%s" % (_tag(GMD, "specification"), _tag(GMD, "CI_Citation")))
-    if spec is not None:
-        title = spec.find(_tag(GMD, "title"))
-        if title is not None and _has_value(title):
-            pass_el = result.find(".//%s" % _tag(GCO, "pass"))
-            if pass_el is not None and _has_value(pass_el):
-                return "Present"
-    return "Empty"
-
-
-# Build list of (display_name, obligation, finder)
-def _conformance_checks():
-    g = GMD
-    c = GCO
-    # (name, obligation, finder)
-    checks = [
-        # Mandatory – identification
-        ("Resource Title", "mandatory", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "citation"), (g, "CI_Citation"), (g, "title")]], r)),
-        ("Abstract", "mandatory", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "abstract")]], r)),
-        ("Topic Category", "mandatory", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "topicCategory"), (g, "MD_TopicCategoryCode")]], r)),
-        ("Keywords", "mandatory", _check_keywords),
-        ("Geographic bounding box", "mandatory", _check_bbox),
-        ("Data Language", "mandatory", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "language")]], r)),
-        ("Scale Denominator", "mandatory", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "spatialResolution"), (g, "MD_Resolution"), (g, "equivalentScale"), (g, "MD_RepresentativeFraction"), (g, "denominator")]], r)),
-        # Mandatory – contact
-        ("Contact Organisation Name", "mandatory", lambda r: _check_single([[(g, "contact"), (g, "CI_ResponsibleParty"), (g, "organisationName")]], r)),
-        ("Contact Email Address", "mandatory", lambda r: _check_single([[(g, "contact"), (g, "CI_ResponsibleParty"), (g, "contactInfo"), (g, "CI_Contact"), (g, "address"), (g, "CI_Address"), (g, "electronicMailAddress")]], r)),
-        ("Contact Role", "mandatory", lambda r: _check_single([[(g, "contact"), (g, "CI_ResponsibleParty"), (g, "role")]], r)),
-        # Mandatory – distribution
-        ("Distribution Online Resource Linkage", "mandatory", _check_distribution_linkage),
-        # Mandatory – data quality
-        ("Lineage Statement", "mandatory", lambda r: _check_single([[(g, "dataQualityInfo"), (g, "DQ_DataQuality"), (g, "lineage"), (g, "LI_Lineage"), (g, "statement")]], r)),
-        ("Data Quality Scope Level", "mandatory", lambda r: _check_single([[(g, "dataQualityInfo"), (g, "DQ_DataQuality"), (g, "scope"), (g, "DQ_Scope"), (g, "level")]], r)),
-        ("Conformance Specification Title", "mandatory", lambda r: _check_single([[(g, "dataQualityInfo"), (g, "DQ_DataQuality"), (g, "report"), (g, "DQ_DomainConsistency"), (g, "result"), (g, "DQ_ConformanceResult"), (g, "specification"), (g, "CI_Citation"), (g, "title")]], r)),
-        ("Conformance Pass", "mandatory", lambda r: _check_single([[(g, "dataQualityInfo"), (g, "DQ_DataQuality"), (g, "report"), (g, "DQ_DomainConsistency"), (g, "result"), (g, "DQ_ConformanceResult"), (g, "pass")]], r)),
-        # Mandatory – metadata section
-        ("Metadata Language Code", "mandatory", lambda r: _check_single([[(g, "language")]], r)),
-        ("Metadata Date Stamp", "mandatory", lambda r: _check_single([[(g, "dateStamp")]], r)),
-        ("Metadata Scope Code", "mandatory", lambda r: _check_single([[(g, "hierarchyLevel")]], r)),
-        # Mandatory – constraints
-        ("Access Constraints", "mandatory", _check_access_constraints),
-        ("Other Constraints", "mandatory", _check_other_constraints),
-        ("Use Limitation", "mandatory", _check_use_limitation),
-        # Conditional
-        ("Publication Date", "conditional", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "citation"), (g, "CI_Citation"), (g, "date"), (g, "CI_Date"), (g, "date")]], r)),
-        ("Reference System Code", "conditional", lambda r: _check_single([[(g, "referenceSystemInfo"), (g, "MD_ReferenceSystem"), (g, "referenceSystemIdentifier"), (g, "RS_Identifier"), (g, "code")]], r)),
-        ("Reference System Code Space", "conditional", lambda r: _check_single([[(g, "referenceSystemInfo"), (g, "MD_ReferenceSystem"), (g, "referenceSystemIdentifier"), (g, "RS_Identifier"), (g, "codeSpace")]], r)),
-        # Optional (sample)
-        ("File Identifier", "optional", lambda r: _check_single([[(g, "fileIdentifier")]], r)),
-        ("Metadata Standard Name", "optional", lambda r: _check_single([[(g, "metadataStandardName")]], r)),
-        ("Metadata Standard Version", "optional", lambda r: _check_single([[(g, "metadataStandardVersion")]], r)),
-        ("Purpose", "optional", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "purpose")]], r)),
-        ("Credit", "optional", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "credit")]], r)),
-        ("Status", "optional", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "status")]], r)),
-        ("Maintenance Frequency", "optional", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "resourceMaintenance"), (g, "MD_MaintenanceInformation"), (g, "maintenanceAndUpdateFrequency")]], r)),
-        ("Graphic Overview", "optional", lambda r: _check_single([[(g, "identificationInfo"), (g, "MD_DataIdentification"), (g, "graphicOverview"), (g, "MD_BrowseGraphic"), (g, "fileName")]], r)),
-    ]
-    return checks
-
-
-def check_one_file(xml_path, checks):
-    """
-    Run all conformance checks on a single XML file using namespace-aware parsing.
-
-    Returns:
-        dict mapping check display_name to "Present" | "Empty" | "Absent".
-        Returns None if the file is not valid ISO 19139 (e.g. root is not MD_Metadata in gmd namespace).
-    """
-    try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-    except ET.ParseError:
-        return None
-
-    # Require root to be MD_Metadata in gmd namespace
-    if root.tag != _tag(GMD, "MD_Metadata"):
-        return None
-
-    results = {}
-    for name, _obligation, finder in checks:
-        try:
-            results[name] = finder(root)
-        except Exception:
-            results[name] = "Absent"
-    return results
-
-
-def process_folder(folder_path, checks):
-    """
-    Process all .xml files in folder_path. Returns (results_dict, errors).
-    results_dict: filename -> check_name -> "Present"|"Empty"|"Absent".
-    errors: list of (filename, error_message).
-    """
-    folder_path = Path(folder_path)
-    if not folder_path.exists():
-        return None, ["Folder not found: %s" % folder_path]
-
-    xml_files = sorted(folder_path.glob("*.xml"))
-    if not xml_files:
-        return None, ["No XML files found in %s" % folder_path]
-
-    results = {}
-    errors = []
-    for xml_file in xml_files:
-        name = xml_file.name
-        row = check_one_file(xml_file, checks)
-        if row is None:
-            errors.append((name, "Not ISO 19139 namespaced (root is not gmd:MD_Metadata)"))
-            continue
-        results[name] = row
-
-    return results, errors
-
-
-def compute_summary(results, checks):
-    """Per-file summary: conformant (all mandatory Present), missing mandatory list, counts."""
-    mandatory = [name for name, obl, _ in checks if obl == "mandatory"]
-    summary = []
-    for filename in sorted(results.keys()):
-        row = results[filename]
-        missing = [n for n in mandatory if row.get(n) != "Present"]
-        conformant = len(missing) == 0
-        present_mandatory = sum(1 for n in mandatory if row.get(n) == "Present")
-        present_conditional = sum(1 for name, obl, _ in checks if obl == "conditional" and row.get(name) == "Present")
-        present_optional = sum(1 for name, obl, _ in checks if obl == "optional" and row.get(name) == "Present")
-        summary.append({
-            "Filename": filename,
-            "Conformant": "Yes" if conformant else "No",
-            "Missing mandatory": ", ".join(missing) if missing else "0",
-            "Missing count": len(missing),
-            "Present mandatory": present_mandatory,
-            "Present conditional": present_conditional,
-            "Present optional": present_optional,
-        })
-    return summary
-
-
-def write_excel_report(results, checks, summary, errors, output_path):
-    """Write Excel workbook: Compliance Summary sheet and Conformance Detail sheet."""
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    obligation_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-    obligation_font = Font(italic=True)
-    obligation_alignment = Alignment(horizontal="center", vertical="center")
-
-    wb = Workbook()
-    # Sheet 1: Compliance Summary
-    ws_sum = wb.active
-    ws_sum.title = "Compliance Summary"
-    headers = [
-        "Filename", "ISO 19139 conformant", "Missing mandatory fields",
-        "Missing count", "Present mandatory", "Present conditional", "Present optional",
-    ]
-    for col, h in enumerate(headers, 1):
-        c = ws_sum.cell(row=1, column=col, value=h)
-        c.fill = header_fill
-        c.font = header_font
-        c.alignment = header_alignment
-    for row_idx, rec in enumerate(summary, 2):
-        ws_sum.cell(row=row_idx, column=1, value=rec["Filename"])
-        ws_sum.cell(row=row_idx, column=2, value=rec["Conformant"])
-        ws_sum.cell(row=row_idx, column=3, value=rec["Missing mandatory"])
-        ws_sum.cell(row=row_idx, column=4, value=rec["Missing count"])
-        ws_sum.cell(row=row_idx, column=5, value=rec["Present mandatory"])
-        ws_sum.cell(row=row_idx, column=6, value=rec["Present conditional"])
-        ws_sum.cell(row=row_idx, column=7, value=rec["Present optional"])
-    for col_num in range(1, len(headers) + 1):
-        ws_sum.column_dimensions[get_column_letter(col_num)].width = 24
-    for row in ws_sum.iter_rows(min_row=2, max_row=ws_sum.max_row, min_col=3, max_col=3):
-        for cell in row:
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-    # Sheet 2: Conformance Detail (row 1 = headers, row 2 = obligation, row 3+ = data)
-    ws_det = wb.create_sheet("Conformance Detail", 1)
-    ws_det.cell(row=1, column=1, value="Filename")
-    c1 = ws_det.cell(row=1, column=1)
-    c1.fill = header_fill
-    c1.font = header_font
-    c1.alignment = header_alignment
-    ws_det.cell(row=2, column=1, value="(obligation)")
-    ws_det.cell(row=2, column=1).fill = obligation_fill
-    ws_det.cell(row=2, column=1).font = obligation_font
-    ws_det.cell(row=2, column=1).alignment = obligation_alignment
-    for col_idx, (name, obligation, _) in enumerate(checks, 2):
-        c = ws_det.cell(row=1, column=col_idx, value=name)
-        c.fill = header_fill
-        c.font = header_font
-        c.alignment = header_alignment
-        c2 = ws_det.cell(row=2, column=col_idx, value=obligation)
-        c2.fill = obligation_fill
-        c2.font = obligation_font
-        c2.alignment = obligation_alignment
-    for row_idx, filename in enumerate(sorted(results.keys()), start=3):
-        ws_det.cell(row=row_idx, column=1, value=filename)
-        row_data = results[filename]
-        for col_idx, (name, _, _) in enumerate(checks, 2):
-            ws_det.cell(row=row_idx, column=col_idx, value=row_data.get(name, "Absent"))
-    ws_det.freeze_panes = "B3"
-    detail_headers = ["Filename"] + [name for name, _, _ in checks]
-    for col_num, header in enumerate(detail_headers, 1):
-        max_length = len(str(header))
-        column_letter = get_column_letter(col_num)
-        for r in range(1, ws_det.max_row + 1):
-            cell = ws_det.cell(row=r, column=col_num)
-            if cell.value and len(str(cell.value)) > max_length:
-                max_length = min(len(str(cell.value)), 100)
-        ws_det.column_dimensions[column_letter].width = min(max_length + 2, 100)
-    for row in ws_det.iter_rows(min_row=3, max_row=ws_det.max_row, min_col=1, max_col=ws_det.max_column):
-        for cell in row:
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-    # Optional: Errors sheet if any files were skipped
-    if errors:
-        ws_err = wb.create_sheet("Errors", 2)
-        for col, h in enumerate(["Filename", "Error"], 1):
-            c = ws_err.cell(row=1, column=col, value=h)
-            c.fill = header_fill
-            c.font = header_font
-            c.alignment = header_alignment
-        for row_idx, (fname, err_msg) in enumerate(errors, 2):
-            ws_err.cell(row=row_idx, column=1, value=fname)
-            ws_err.cell(row=row_idx, column=2, value=err_msg)
-        ws_err.column_dimensions["A"].width = 30
-        ws_err.column_dimensions["B"].width = 50
-
-    wb.save(output_path)
-
-
-def parse_args():
-    parser = argparse.ArgumentParser(
-        description="Strict namespace-aware ISO 19139 conformance check; produces an Excel report."
-    )
-    parser.add_argument(
-        "input_folder",
-        nargs="?",
-        default="xml",
-        help="Folder containing .xml metadata files (default: xml)",
-    )
-    args = parser.parse_args()
-    folder = Path(args.input_folder)
-    folder_name = folder.name
-    reports_dir = Path("reports")
-    reports_dir.mkdir(parents=True, exist_ok=True)
-    output_file = reports_dir / ("conformance_report_%s.xlsx" % folder_name)
-    return folder, output_file
-
-
-def main():
-    folder, output_file = parse_args()
-    if not folder.exists():
-        print("Error: Folder not found: %s" % folder)
-        return
-    xml_count = len(list(folder.glob("*.xml")))
-    if xml_count == 0:
-        print("No XML files found in %s" % folder)
-        return
-
-    checks = _conformance_checks()
-    print("Conformance check (strict ISO 19139 namespaces) for: %s" % folder)
-    print("-" * 60)
-    print("Found %d XML files" % xml_count)
-
-    results, errors = process_folder(folder, checks)
-    if results is None:
-        for e in errors:
-            print(e)
-        return
-
-    for fname in sorted(results.keys()):
-        print("Checked: %s" % fname)
-    for fname, err in errors:
-        print("Skipped: %s — %s" % (fname, err))
-
-    summary = compute_summary(results, checks)
-    write_excel_report(results, checks, summary, errors, output_file)
-    conformant_count = sum(1 for s in summary if s["Conformant"] == "Yes")
-    non_conformant = len(summary) - conformant_count
-    print("-" * 60)
-    print("Report written: %s" % output_file)
-    print("ISO 19139 conformant: %d | Non-conformant (missing mandatory): %d" % (conformant_count, non_conformant))
-    if errors:
-        print("Skipped (not namespaced ISO 19139): %d" % len(errors))
-    print("Done.")
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Strict namespace-aware ISO 19139 conformance checker.
+
+Processes all ISO19139 .xml files exported from ArcGIS Pro or ArcGIS Online in a 
+given folder. For each file with root gmd:MD_Metadata (proper ISO 19139 namespacing),
+produces an Excel report showing how it satisfies obligatory (mandatory), optional,
+and conditional elements per ISO 19139 / INSPIRE (Regulation 1205/2008). Uses the
+official gmd/gco namespaces so that only properly namespaced ISO 19139 content is
+recognised.
+
+Progress and errors for each file are printed to the console during the run.
+
+Expects XML with root gmd:MD_Metadata (proper ISO 19139 namespacing). Files in
+ArcGIS internal format are skipped. Aligned with INSPIRE Regulation 1205/2008 for
+mandatory/optional/conditional classification.
+
+The script is provided as part of the LandIS Soil Portal project, but can be used with 
+any ISO 19139 metadata files that are properly namespaced.
+
+Stephen Hallett, Cranfield University, 2026
+
+Usage:
+    python check_conformance.py [folder]
+    Default folder: xml. Output: conformance_report_<foldername>.xlsx
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# lxml (libxml2) parses and navigates the tree in C and is markedly faster than
+# the stdlib parser on folders of metadata files; fall back to ElementTree when
+# it is not installed (both expose the same find()/Clark-notation API).
+try:
+    from lxml import etree as ET
+    _PARSE_ERROR = ET.XMLSyntaxError
+    _PARSER = ET.XMLParser(huge_tree=True, collect_ids=False, resolve_entities=False)
+except ImportError:
+    # On Python 3 this transparently uses the C accelerator (_elementtree /
+    # expat), so even the fallback parses in C; only tree navigation is slower.
+    import xml.etree.ElementTree as ET
+    _PARSE_ERROR = ET.ParseError
+    _PARSER = None
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+
+# ISO 19139 namespace URIs (ISO/TC 211)
+GMD = "http://www.isotc211.org/2005/gmd"
+GCO = "http://www.isotc211.org/2005/gco"
+
+
+def _tag(ns, local):
+    """Return Clark-notation tag for ElementTree find()."""
+    return "{%s}%s" % (ns, local)
+
+
+def _path(*steps):
+    """Join (namespace_uri, local_name) steps into a tuple of Clark tags, once."""
+    return tuple(_tag(ns, local) for ns, local in steps)
+
+
+def _iter_path(root, path):
+    """
+    Return every element reached by following path (Clark tags, or "*" for any
+    child) from root, walking direct children only — no descendant scans.
+    """
+    if root is None:
+        return []
+    # Iterative level-by-level walk: no generator frames or recursion, and
+    # document order is preserved.
+    elems = [root]
+    for tag in path:
+        elems = [child for el in elems for child in el.iterfind(tag)]
+        if not elems:
+            break
+    return elems
+
+
+def _find(root, path):
+    """
+    Find an element by a path of Clark-notation tags (see _path).
+    Returns the element or None if any step fails.
+    """
+    for tag in path:
+        if root is None:
+            return None
+        root = root.find(tag)
+    return root
+
+
+def _get_text(element):
+    """
+    Collect all text content from an element and its descendants (e.g. from
+    gco:CharacterString, gco:Date, or code list elements). Returns stripped
+    string; empty string if element is None or has no text.
+    """
+    if element is None:
+        return ""
+    # itertext() walks the subtree in C, avoiding Python-level recursion.
+    return "".join(element.itertext()).strip()
+
+
+def _has_value(element):
+    """Return True if element exists and has non-empty text content."""
+    return bool(_get_text(element)) if element is not None else False
+
+
+# Shared subtree paths, joined to Clark notation once at import rather than
+# once per check per file.
+_PATH_ID_INFO = _path((GMD, "identificationInfo"), (GMD, "MD_DataIdentification"))
+_PATH_DQ = _path((GMD, "dataQualityInfo"), (GMD, "DQ_DataQuality"))
+_PATH_DIST = _path((GMD, "distributionInfo"), (GMD, "MD_Distribution"))
+_PATH_CONTACT = _path((GMD, "contact"), (GMD, "CI_ResponsibleParty"))
+_PATH_CITATION = _path((GMD, "citation"), (GMD, "CI_Citation"))
+_PATH_CONF_RESULT = _path(
+    (GMD, "report"), (GMD, "DQ_DomainConsistency"),
+    (GMD, "result"), (GMD, "DQ_ConformanceResult"),
+)
+_PATH_REF_SYS_ID = _path(
+    (GMD, "referenceSystemInfo"), (GMD, "MD_ReferenceSystem"),
+    (GMD, "referenceSystemIdentifier"), (GMD, "RS_Identifier"),
+)
+
+
+# Conformance checks: (display_name, obligation, spec). A spec is either a
+# (context_key, path) pair — the common single-path case, dispatched inline in
+# check_one_file without a function call — or a callable taking the per-file
+# context dict (see _build_context) for the handful of checks needing custom
+# logic. Either form yields "Present", "Empty" or "Absent". The context caches
+# the subtree roots that most checks descend from (identification, data
+# quality, distribution, contact) so the same ancestor chains are not
+# re-resolved for every check.
+
+
+def _build_context(root):
+    """Resolve the shared subtree roots once per file for the check finders."""
+    id_info = _find(root, _PATH_ID_INFO)
+    dq = _find(root, _PATH_DQ)
+    return {
+        "root": root,
+        "id_info": id_info,
+        "dq": dq,
+        "dist": _find(root, _PATH_DIST),
+        "contact": _find(root, _PATH_CONTACT),
+        # Prefixes shared by more than one check, resolved once as well.
+        "citation": _find(id_info, _PATH_CITATION),
+        "conf_result": _find(dq, _PATH_CONF_RESULT),
+        "ref_sys_id": _find(root, _PATH_REF_SYS_ID),
+    }
+
+
+def _check_bbox(ctx):
+    """All four geographic bounding box elements must exist and have content."""
+    base = _path(
+        (GMD, "extent"),
+        (GMD, "EX_Extent"),
+        (GMD, "geographicElement"),
+        (GMD, "EX_GeographicBoundingBox"),
+    )
+    id_info = ctx["id_info"]
+    if id_info is None:
+        return "Absent"
+    for comp in ["westBoundLongitude", "eastBoundLongitude", "southBoundLatitude", "northBoundLatitude"]:
+        el = _find(id_info, base + (_tag(GMD, comp),))
+        if el is None or not _has_value(el):
+            return "Absent" if el is None else "Empty"
+    return "Present"
+
+
+_PATH_KEYWORD = _path(
+    (GMD, "descriptiveKeywords"), (GMD, "MD_Keywords"), (GMD, "keyword"),
+)
+# Constraint containers sit under resourceConstraints as MD_Constraints,
+# MD_LegalConstraints or MD_SecurityConstraints; "*" matches any of them.
+_PATH_USE_LIMITATION = (_tag(GMD, "resourceConstraints"), "*", _tag(GMD, "useLimitation"))
+_PATH_ACCESS_CONSTRAINTS = (_tag(GMD, "resourceConstraints"), "*", _tag(GMD, "accessConstraints"))
+_PATH_OTHER_CONSTRAINTS = (_tag(GMD, "resourceConstraints"), "*", _tag(GMD, "otherConstraints"))
+_PATH_LINKAGE = _path(
+    (GMD, "transferOptions"), (GMD, "MD_DigitalTransferOptions"),
+    (GMD, "onLine"), (GMD, "CI_OnlineResource"), (GMD, "linkage"),
+)
+
+
+def _check_keywords(ctx):
+    """At least one keyword with content under descriptiveKeywords."""
+    id_info = ctx["id_info"]
+    if id_info is None:
+        return "Absent"
+    # Can have multiple descriptiveKeywords; each can have multiple keyword
+    for kw in _iter_path(id_info, _PATH_KEYWORD):
+        if _has_value(kw):
+            return "Present"
+    return "Empty"
+
+
+def _check_use_limitation(ctx):
+    """useLimitation can appear in MD_Constraints or MD_LegalConstraints."""
+    id_info = ctx["id_info"]
+    if id_info is None:
+        return "Absent"
+    saw = False
+    for use_lim in _iter_path(id_info, _PATH_USE_LIMITATION):
+        saw = True
+        if _has_value(use_lim):
+            return "Present"
+    return "Empty" if saw else "Absent"
+
+
+def _check_access_constraints(ctx):
+    """accessConstraints in MD_LegalConstraints or RestrictCd in MD_Constraints."""
+    id_info = ctx["id_info"]
+    if id_info is None:
+        return "Absent"
+    saw = False
+    for ac in _iter_path(id_info, _PATH_ACCESS_CONSTRAINTS):
+        saw = True
+        if _has_value(ac):
+            return "Present"
+    return "Empty" if saw else "Absent"
+
+
+def _check_other_constraints(ctx):
+    id_info = ctx["id_info"]
+    if id_info is None:
+        return "Absent"
+    saw = False
+    for other in _iter_path(id_info, _PATH_OTHER_CONSTRAINTS):
+        saw = True
+        if _has_value(other):
+            return "Present"
+    return "Empty" if saw else "Absent"
+
+
+def _check_distribution_linkage(ctx):
+    """Distribution: onLine/CI_OnlineResource/linkage (URL or CharacterString)."""
+    dist = ctx["dist"]
+    if dist is None:
+        return "Absent"
+    saw = False
+    for linkage in _iter_path(dist, _PATH_LINKAGE):
+        saw = True
+        if _has_value(linkage):
+            return "Present"
+    return "Empty" if saw else "Absent"
+
+
+# Build list of (display_name, obligation, finder)
+def _conformance_checks():
+    g = GMD
+
+    def single(key, *steps):
+        # Declarative spec: context key plus pre-joined path, no closure.
+        return (key, _path(*steps))
+
+    # (name, obligation, finder); mandatory checks are listed first, which
+    # the --summary-only early exit relies on.
+    checks = [
+        # Mandatory – identification
+        ("Resource Title", "mandatory", single("citation", (g, "title"))),
+        ("Abstract", "mandatory", single("id_info", (g, "abstract"))),
+        ("Topic Category", "mandatory", single("id_info", (g, "topicCategory"), (g, "MD_TopicCategoryCode"))),
+        ("Keywords", "mandatory", _check_keywords),
+        ("Geographic bounding box", "mandatory", _check_bbox),
+        ("Data Language", "mandatory", single("id_info", (g, "language"))),
+        ("Scale Denominator", "mandatory", single("id_info", (g, "spatialResolution"), (g, "MD_Resolution"), (g, "equivalentScale"), (g, "MD_RepresentativeFraction"), (g, "denominator"))),
+        # Mandatory – contact
+        ("Contact Organisation Name", "mandatory", single("contact", (g, "organisationName"))),
+        ("Contact Email Address", "mandatory", single("contact", (g, "contactInfo"), (g, "CI_Contact"), (g, "address"), (g, "CI_Address"), (g, "electronicMailAddress"))),
+        ("Contact Role", "mandatory", single("contact", (g, "role"))),
+        # Mandatory – distribution
+        ("Distribution Online Resource Linkage", "mandatory", _check_distribution_linkage),
+        # Mandatory – data quality
+        ("Lineage Statement", "mandatory", single("dq", (g, "lineage"), (g, "LI_Lineage"), (g, "statement"))),
+        ("Data Quality Scope Level", "mandatory", single("dq", (g, "scope"), (g, "DQ_Scope"), (g, "level"))),
+        ("Conformance Specification Title", "mandatory", single("conf_result", (g, "specification"), (g, "CI_Citation"), (g, "title"))),
+        ("Conformance Pass", "mandatory", single("conf_result", (g, "pass"))),
+        # Mandatory – metadata section
+        ("Metadata Language Code", "mandatory", single("root", (g, "language"))),
+        ("Metadata Date Stamp", "mandatory", single("root", (g, "dateStamp"))),
+        ("Metadata Scope Code", "mandatory", single("root", (g, "hierarchyLevel"))),
+        # Mandatory – constraints
+        ("Access Constraints", "mandatory", _check_access_constraints),
+        ("Other Constraints", "mandatory", _check_other_constraints),
+        ("Use Limitation", "mandatory", _check_use_limitation),
+        # Conditional
+        ("Publication Date", "conditional", single("citation", (g, "date"), (g, "CI_Date"), (g, "date"))),
+        ("Reference System Code", "conditional", single("ref_sys_id", (g, "code"))),
+        ("Reference System Code Space", "conditional", single("ref_sys_id", (g, "codeSpace"))),
+        # Optional (sample)
+        ("File Identifier", "optional", single("root", (g, "fileIdentifier"))),
+        ("Metadata Standard Name", "optional", single("root", (g, "metadataStandardName"))),
+        ("Metadata Standard Version", "optional", single("root", (g, "metadataStandardVersion"))),
+        ("Purpose", "optional", single("id_info", (g, "purpose"))),
+        ("Credit", "optional", single("id_info", (g, "credit"))),
+        ("Status", "optional", single("id_info", (g, "status"))),
+        ("Maintenance Frequency", "optional", single("id_info", (g, "resourceMaintenance"), (g, "MD_MaintenanceInformation"), (g, "maintenanceAndUpdateFrequency"))),
+        ("Graphic Overview", "optional", single("id_info", (g, "graphicOverview"), (g, "MD_BrowseGraphic"), (g, "fileName"))),
+    ]
+    return checks
+
+
+def check_one_file(xml_path, checks, summary_only=False):
+    """
+    Run all conformance checks on a single XML file using namespace-aware parsing.
+
+    With summary_only, evaluation stops after the mandatory checks whenever one
+    of them is not Present — the file is already non-conformant, so the
+    conditional/optional checks are skipped (the checks table lists mandatory
+    checks first).
+
+    Returns:
+        dict mapping check display_name to "Present" | "Empty" | "Absent".
+        Returns None if the file is not valid ISO 19139 (e.g. root is not MD_Metadata in gmd namespace).
+    """
+    # Parse incrementally so files whose root is not gmd:MD_Metadata (e.g.
+    # ArcGIS-style exports) are rejected on the opening tag instead of being
+    # fully parsed and then skipped.
+    try:
+        if _PARSER is not None:
+            events = ET.iterparse(
+                str(xml_path), events=("start",),
+                huge_tree=True, collect_ids=False, resolve_entities=False,
+            )
+        else:
+            events = ET.iterparse(str(xml_path), events=("start",))
+        _, root = next(events)
+        # Require root to be MD_Metadata in gmd namespace
+        if root.tag != _tag(GMD, "MD_Metadata"):
+            return None
+        for _ in events:
+            pass
+    except (_PARSE_ERROR, StopIteration):
+        return None
+
+    ctx = _build_context(root)
+    results = {}
+    missing_mandatory = False
+    has_value = _has_value  # local binding: avoids a global lookup per check
+    for name, obligation, spec in checks:
+        if summary_only and missing_mandatory and obligation != "mandatory":
+            break
+        if type(spec) is tuple:
+            # Single-path check, dispatched inline: descend from the cached
+            # context subtree step by step.
+            el = ctx[spec[0]]
+            for tag in spec[1]:
+                if el is None:
+                    break
+                el = el.find(tag)
+            if el is None:
+                results[name] = "Absent"
+            else:
+                results[name] = "Present" if has_value(el) else "Empty"
+        else:
+            try:
+                results[name] = spec(ctx)
+            except Exception:
+                results[name] = "Absent"
+        if obligation == "mandatory" and results[name] != "Present":
+            missing_mandatory = True
+    return results
+
+
+def _check_one_cached(xml_path, checks, cache_dir, summary_only=False):
+    """
+    Check one file, reusing a cached result from a previous run when the file
+    bytes are unchanged. With cache_dir None the cache is bypassed entirely.
+
+    The cache stores only the check results keyed by a hash of the file
+    content, so edited files are re-checked automatically and stale entries
+    are simply never read again. Summary-only results are cached under a
+    separate key as they may omit the non-mandatory checks.
+    """
+    if cache_dir is None:
+        return check_one_file(xml_path, checks, summary_only)
+    digest = hashlib.blake2b(xml_path.read_bytes(), digest_size=16).hexdigest()
+    cache_file = cache_dir / ("%s%s.json" % (digest, "-summary" if summary_only else ""))
+    if cache_file.exists():
+        try:
+            return json.loads(cache_file.read_text())["results"]
+        except (ValueError, KeyError, OSError):
+            pass  # unreadable entry: fall through and recompute
+    results = check_one_file(xml_path, checks, summary_only)
+    try:
+        cache_file.write_text(json.dumps({"results": results}))
+    except OSError:
+        pass  # cache is best-effort; the run still succeeds without it
+    return results
+
+
+# Per-worker state, rebuilt once per pool process; the checks contain lambdas
+# so cannot be pickled and shipped from the parent.
+_WORKER_CHECKS = None
+_WORKER_CACHE_DIR = None
+_WORKER_SUMMARY_ONLY = False
+
+
+def _init_worker(cache_dir, summary_only):
+    """Pool initializer: build the checks table once per worker process."""
+    global _WORKER_CHECKS, _WORKER_CACHE_DIR, _WORKER_SUMMARY_ONLY
+    _WORKER_CHECKS = _conformance_checks()
+    _WORKER_CACHE_DIR = cache_dir
+    _WORKER_SUMMARY_ONLY = summary_only
+
+
+def _check_worker(xml_path):
+    """Check one file in a pool worker; returns (filename, results-or-None)."""
+    return xml_path.name, _check_one_cached(
+        xml_path, _WORKER_CHECKS, _WORKER_CACHE_DIR, _WORKER_SUMMARY_ONLY
+    )
+
+
+def process_folder(xml_files, checks, cache_dir=None, summary_only=False):
+    """
+    Process the given .xml files (see main's scandir pass). Returns
+    (results_dict, errors).
+    results_dict: filename -> check_name -> "Present"|"Empty"|"Absent".
+    errors: list of (filename, error_message).
+
+    Files are independent, so larger folders are checked in parallel across a
+    process pool; small folders stay serial to avoid the pool start-up cost.
+    """
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    if len(xml_files) >= 4:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker, initargs=(cache_dir, summary_only),
+        ) as pool:
+            checked = pool.map(_check_worker, xml_files, chunksize=8)
+            results, errors = _collect_results(checked)
+    else:
+        results, errors = _collect_results(
+            (f.name, _check_one_cached(f, checks, cache_dir, summary_only)) for f in xml_files
+        )
+
+    return results, errors
+
+
+def _collect_results(checked):
+    """Split (filename, row) pairs into the results dict and skip-error list."""
+    results = {}
+    errors = []
+    for name, row in checked:
+        if row is None:
+            errors.append((name, "Not ISO 19139 namespaced (root is not gmd:MD_Metadata)"))
+            continue
+        results[name] = row
+    return results, errors
+
+
+def compute_summary(results, checks, ordered_names):
+    """Per-file summary: conformant (all mandatory Present), missing mandatory list, counts."""
+    summary = []
+    for filename in ordered_names:
+        row = results[filename]
+        # One pass over the checks per file: tally Present per obligation and
+        # collect missing mandatory names as we go.
+        missing = []
+        present = {"mandatory": 0, "conditional": 0, "optional": 0}
+        for name, obligation, _ in checks:
+            if row.get(name) == "Present":
+                present[obligation] += 1
+            elif obligation == "mandatory":
+                missing.append(name)
+        summary.append({
+            "Filename": filename,
+            "Conformant": "Yes" if not missing else "No",
+            "Missing mandatory": ", ".join(missing) if missing else "0",
+            "Missing count": len(missing),
+            "Present mandatory": present["mandatory"],
+            "Present conditional": present["conditional"],
+            "Present optional": present["optional"],
+        })
+    return summary
+
+
+def write_excel_report(results, checks, summary, errors, output_path, ordered_names, summary_only=False):
+    """
+    Write Excel workbook: Compliance Summary sheet and Conformance Detail
+    sheet. With summary_only the detail sheet is omitted — per-file results
+    may be truncated after the first missing mandatory element in that mode.
+    """
+    header_fill = PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFFFF")
+    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    obligation_fill = PatternFill(start_color="FFE0E0E0", end_color="FFE0E0E0", fill_type="solid")
+    obligation_font = Font(italic=True)
+    obligation_alignment = Alignment(horizontal="center", vertical="center")
+    body_alignment = Alignment(wrap_text=True, vertical="top")
+
+    # Write-only mode streams each appended row straight out instead of
+    # keeping a cell grid in memory; styling is applied via WriteOnlyCell and
+    # column widths must be set before the first append.
+    wb = Workbook(write_only=True)
+
+    def styled(ws, value, fill=None, font=None, alignment=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if fill is not None:
+            cell.fill = fill
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    # Sheet 1: Compliance Summary
+    ws_sum = wb.create_sheet("Compliance Summary")
+    headers = [
+        "Filename", "ISO 19139 conformant", "Missing mandatory fields",
+        "Missing count", "Present mandatory", "Present conditional", "Present optional",
+    ]
+    for col_num in range(1, len(headers) + 1):
+        ws_sum.column_dimensions[get_column_letter(col_num)].width = 24
+    ws_sum.append([styled(ws_sum, h, header_fill, header_font, header_alignment) for h in headers])
+    for rec in summary:
+        ws_sum.append([
+            rec["Filename"],
+            rec["Conformant"],
+            styled(ws_sum, rec["Missing mandatory"], alignment=body_alignment),
+            rec["Missing count"],
+            rec["Present mandatory"],
+            rec["Present conditional"],
+            rec["Present optional"],
+        ])
+
+    # Sheet 2: Conformance Detail (row 1 = headers, row 2 = obligation, row 3+ = data)
+    if not summary_only:
+        ws_det = wb.create_sheet("Conformance Detail")
+        detail_headers = ["Filename"] + [name for name, _, _ in checks]
+        sorted_files = ordered_names
+        # Column widths are derived from the data up front (write-only sheets
+        # cannot be re-scanned after the rows are appended).
+        widths = [max(len("Filename"), max((len(f) for f in sorted_files), default=0))]
+        for name, obligation, _ in checks:
+            width = max(len(name), len(obligation))
+            for filename in sorted_files:
+                width = max(width, len(results[filename].get(name, "Absent")))
+            widths.append(width)
+        for col_num, width in enumerate(widths, 1):
+            ws_det.column_dimensions[get_column_letter(col_num)].width = min(width + 2, 100)
+        ws_det.freeze_panes = "B3"
+        ws_det.append([styled(ws_det, h, header_fill, header_font, header_alignment) for h in detail_headers])
+        ws_det.append(
+            [styled(ws_det, "(obligation)", obligation_fill, obligation_font, obligation_alignment)]
+            + [styled(ws_det, obl, obligation_fill, obligation_font, obligation_alignment) for _, obl, _ in checks]
+        )
+        for filename in sorted_files:
+            row_data = results[filename]
+            ws_det.append(
+                [styled(ws_det, filename, alignment=body_alignment)]
+                + [styled(ws_det, row_data.get(name, "Absent"), alignment=body_alignment) for name, _, _ in checks]
+            )
+
+
+    # Optional: Errors sheet if any files were skipped
+    if errors:
+        ws_err = wb.create_sheet("Errors")
+        ws_err.column_dimensions["A"].width = 30
+        ws_err.column_dimensions["B"].width = 50
+        ws_err.append([styled(ws_err, h, header_fill, header_font, header_alignment) for h in ["Filename", "Error"]])
+        for fname, err_msg in errors:
+            ws_err.append([fname, err_msg])
+
+    wb.save(output_path)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Strict namespace-aware ISO 19139 conformance check; produces an Excel report."
+    )
+    parser.add_argument(
+        "input_folder",
+        nargs="?",
+        default="xml",
+        help="Folder containing .xml metadata files (default: xml)",
+    )
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Stop checking each file at its first missing mandatory element "
+             "and omit the Conformance Detail sheet (faster for large folders)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for cached per-file results, reused across runs while "
+             "the file content is unchanged (default: no caching)",
+    )
+    args = parser.parse_args()
+    folder = Path(args.input_folder)
+    folder_name = folder.name
+    reports_dir = Path("reports")
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    output_file = reports_dir / ("conformance_report_%s.xlsx" % folder_name)
+    return folder, output_file, args.cache_dir, args.summary_only
+
+
+def main():
+    folder, output_file, cache_dir, summary_only = parse_args()
+    if not folder.exists():
+        print("Error: Folder not found: %s" % folder)
+        return
+    # One directory pass: scandir filters by extension and drops zero-byte
+    # files in the same walk (main previously globbed once just to count,
+    # then process_folder globbed again).
+    with os.scandir(folder) as entries:
+        xml_files = sorted(
+            Path(entry.path) for entry in entries
+            if entry.is_file() and entry.name.endswith(".xml") and entry.stat().st_size > 0
+        )
+    if not xml_files:
+        print("No XML files found in %s" % folder)
+        return
+
+    checks = _conformance_checks()
+    print("Conformance check (strict ISO 19139 namespaces) for: %s" % folder)
+    print("-" * 60)
+    print("Found %d XML files" % len(xml_files))
+
+    results, errors = process_folder(xml_files, checks, cache_dir, summary_only)
+
+    # Sort the processed filenames once; the console listing, summary and
+    # report sheets all share the same ordering.
+    ordered_names = sorted(results)
+    for fname in ordered_names:
+        print("Checked: %s" % fname)
+    for fname, err in errors:
+        print("Skipped: %s — %s" % (fname, err))
+
+    summary = compute_summary(results, checks, ordered_names)
+    write_excel_report(results, checks, summary, errors, output_file, ordered_names, summary_only)
+    conformant_count = sum(1 for s in summary if s["Conformant"] == "Yes")
+    non_conformant = len(summary) - conformant_count
+    print("-" * 60)
+    print("Report written: %s" % output_file)
+    print("ISO 19139 conformant: %d | Non-conformant (missing mandatory): %d" % (conformant_count, non_conformant))
+    if errors:
+        print("Skipped (not namespaced ISO 19139): %d" % len(errors))
+    print("Done.")
+
+
+if __name__ == "__main__":
+    main()
@@ -42,14 +42,34 @@ Usage:
 """
 
 import argparse
-import xml.etree.ElementTree as ET
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils import get_column_letter
+import functools
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# lxml (libxml2) parses in C and is markedly faster than the stdlib parser on
+# folders of metadata files; fall back to ElementTree when it is not installed
+# (both expose the same find()/attribute API used below).
+try:
+    from lxml import etree as ET
+    _PARSE_ERROR = ET.XMLSyntaxError
+    # Hardened and trimmed: metadata exports carry no DTDs, entities,
+    # comments or PIs the extractor reads, so skip that work at parse time.
+    _PARSER = ET.XMLParser(
+        huge_tree=True, collect_ids=False, resolve_entities=False,
+        no_network=True, remove_comments=True, remove_pis=True,
+    )
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _PARSE_ERROR = ET.ParseError
+    _PARSER = None
 import html
 import re
 from pathlib import Path
-from collections import OrderedDict
+from collections import namedtuple
+
 
 # ISO 19139 / INSPIRE obligation per exported field name (Regulation 1205/2008, INSPIRE TG).
 # Used for: (1) the optionality row in "Metadata Export", (2) which fields count as
@@ -86,6 +106,14 @@ FIELD_OBLIGATION = {
 }
 # All other fields (ArcGIS-specific, optional contact details, etc.) are optional unless listed above.
 
+# Field names and obligations recur once per file across the whole export;
+# interning them keeps a single copy of each and lets dict lookups take the
+# identity fast path.
+FIELD_OBLIGATION = {sys.intern(k): sys.intern(v) for k, v in FIELD_OBLIGATION.items()}
+
+# The mandatory subset, precomputed for the per-file compliance pass.
+_MANDATORY_FIELDS = frozenset(k for k, v in FIELD_OBLIGATION.items() if v == "mandatory")
+
 # ISO 19139 codelist labels for report output (from gmxCodelists etc.).
 # ArcGIS exports often use numeric 'value' (e.g. "005" for licence); we map to readable labels.
 # by_num (integer -> display label) is sourced from Esri ArcGIS Pro Metadata Toolkit:
@@ -98,13 +126,23 @@ FIELD_OBLIGATION = {
 _ARCGIS_EXCEL_CODELIST_TO_OURS = {"MD_CharSetCd": "MD_CharacterSetCode"}
 
 
+# Deletion tables and precompiled pattern for the code/label helpers below,
+# which run once per codelist value resolved. str.translate deletes the
+# unwanted characters in a single C-level table scan, cheaper than a regex.
+_NORMALISE_DEL = str.maketrans("", "", " \t\r\n\f\v-/")
+_CODE_KEY_DEL = str.maketrans("", "", " \t\r\n\f\v-")
+_CAMEL_SPLIT_RE = re.compile(r"(?<=.)(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalise_code(s):
     """Normalise standard/profile code for by_name lookup (lowercase, no spaces/hyphens)."""
     if not s or not isinstance(s, str):
         return ""
-    return re.sub(r"[\s\-/]", "", s).lower().split("(")[0].strip()
+    return s.translate(_NORMALISE_DEL).lower().split("(", 1)[0].strip()
 
 
+@functools.lru_cache(maxsize=4096)
 def _format_code_as_label(std_code):
     """Turn a camelCase or lowercase code name into a display label (UK spelling where applicable)."""
     if not std_code or not isinstance(std_code, str):
@@ -114,14 +152,9 @@ def _format_code_as_label(std_code):
         return "Reserved"
     if "/" in s:
         s = s.split("/")[-1]
-    out = []
-    for i, c in enumerate(s):
-        if c.isupper() and i:
-            out.append(" ")
-            out.append(c)
-        else:
-            out.append(c.upper() if i == 0 or (i > 0 and out[-1] == " ") else c.lower())
-    result = "".join(out).replace("  ", " ").strip()
+    # Break before each interior capital in one C-level regex pass, then
+    # capitalise word by word (same output as the old per-character loop).
+    result = " ".join(w[:1].upper() + w[1:].lower() for w in _CAMEL_SPLIT_RE.sub(" ", s).split())
     if result.lower() == "license":
         return "Licence"
     return result
@@ -140,6 +173,9 @@ def _load_arcgis_coded_values_from_excel(excel_path):
     if not path.is_file():
         return None
     try:
+        # data_only=True swaps formulas for their cached values, which is fine
+        # here because this workbook is only ever read — never write back a
+        # workbook loaded this way, or the formulas are lost.
         wb = load_workbook(path, read_only=True, data_only=True)
         ws = wb["Coded Values"]
         rows = list(ws.iter_rows(min_row=5, max_row=600, values_only=True))
@@ -163,219 +199,222 @@ def _load_arcgis_coded_values_from_excel(excel_path):
     return result
 
 
+# Inlined (codelist_name, arc_code, std_code) from https://github.com/Esri/arcgis-pro-metadata-toolkit/tree/master/resourcesArcGIS Metadata Details 20211130.xlsx
+# so by_num can be built without requiring the Excel file. Used when the file
+# is not present. Frozen as a tuple of tuples: built once at import and shared
+# read-only, instead of re-allocating ~170 tuples per call.
+_INLINED_ARCGIS_CODED_VALUES = (
+    ("CI_PresentationFormCode", "001", "documentDigital"),
+    ("CI_PresentationFormCode", "002", "documentHardcopy"),
+    ("CI_PresentationFormCode", "003", "imageDigital"),
+    ("CI_PresentationFormCode", "004", "imageHardcopy"),
+    ("CI_PresentationFormCode", "005", "mapDigital"),
+    ("CI_PresentationFormCode", "006", "mapHardcopy"),
+    ("CI_PresentationFormCode", "007", "modelDigital"),
+    ("CI_PresentationFormCode", "008", "modelHardcopy"),
+    ("CI_PresentationFormCode", "009", "profileDigital"),
+    ("CI_PresentationFormCode", "010", "profileHardcopy"),
+    ("CI_PresentationFormCode", "011", "tableDigital"),
+    ("CI_PresentationFormCode", "012", "tableHardcopy"),
+    ("CI_PresentationFormCode", "013", "videoDigital"),
+    ("CI_PresentationFormCode", "014", "videoHardcopy"),
+    ("CI_PresentationFormCode", "015", "audioDigital"),
+    ("CI_PresentationFormCode", "016", "audioHardcopy"),
+    ("CI_PresentationFormCode", "017", "multimediaDigital"),
+    ("CI_PresentationFormCode", "018", "multimediaHardcopy"),
+    ("CI_PresentationFormCode", "019", "diagramDigital"),
+    ("CI_PresentationFormCode", "020", "diagramHardcopy"),
+    ("CI_PresentationFormCode", "021", "physicalObject"),
+    ("CI_RoleCode", "001", "resourceProvider"),
+    ("CI_RoleCode", "002", "custodian"),
+    ("CI_RoleCode", "003", "owner"),
+    ("CI_RoleCode", "004", "user"),
+    ("CI_RoleCode", "005", "distributor"),
+    ("CI_RoleCode", "006", "originator"),
+    ("CI_RoleCode", "007", "pointOfContact"),
+    ("CI_RoleCode", "008", "principalInvestigator"),
+    ("CI_RoleCode", "009", "processor"),
+    ("CI_RoleCode", "010", "publisher"),
+    ("CI_RoleCode", "011", "author"),
+    ("CI_RoleCode", "012", "collaborator"),
+    ("CI_RoleCode", "013", "editor"),
+    ("CI_RoleCode", "014", "mediator"),
+    ("CI_RoleCode", "015", "rightsHolder"),
+    ("CI_RoleCode", "016", "sponsor"),
+    ("CI_RoleCode", "017", "coAuthor"),
+    ("CI_RoleCode", "018", "contributor"),
+    ("CI_RoleCode", "019", "funder"),
+    ("CI_RoleCode", "020", "stakeholder"),
+    ("MD_MaintenanceFrequencyCode", "001", "continual"),
+    ("MD_MaintenanceFrequencyCode", "002", "daily"),
+    ("MD_MaintenanceFrequencyCode", "003", "weekly"),
+    ("MD_MaintenanceFrequencyCode", "004", "fortnightly"),
+    ("MD_MaintenanceFrequencyCode", "005", "monthly"),
+    ("MD_MaintenanceFrequencyCode", "006", "quarterly"),
+    ("MD_MaintenanceFrequencyCode", "007", "biannually"),
+    ("MD_MaintenanceFrequencyCode", "008", "annually"),
+    ("MD_MaintenanceFrequencyCode", "009", "asNeeded"),
+    ("MD_MaintenanceFrequencyCode", "010", "irregular"),
+    ("MD_MaintenanceFrequencyCode", "011", "notPlanned"),
+    ("MD_MaintenanceFrequencyCode", "012", "unknown"),
+    ("MD_MaintenanceFrequencyCode", "013", "semimonthly"),
+    ("MD_MaintenanceFrequencyCode", "014", "periodic"),
+    ("MD_MaintenanceFrequencyCode", "015", "biennially"),
+    ("MD_ProgressCode", "001", "completed"),
+    ("MD_ProgressCode", "002", "historicalArchive"),
+    ("MD_ProgressCode", "003", "obsolete"),
+    ("MD_ProgressCode", "004", "onGoing"),
+    ("MD_ProgressCode", "005", "planned"),
+    ("MD_ProgressCode", "006", "required"),
+    ("MD_ProgressCode", "007", "underDevelopment"),
+    ("MD_ProgressCode", "008", "proposed"),
+    ("MD_ProgressCode", "009", "final"),
+    ("MD_ProgressCode", "010", "pending"),
+    ("MD_ProgressCode", "011", "retired"),
+    ("MD_ProgressCode", "012", "superseded"),
+    ("MD_ProgressCode", "013", "tentative"),
+    ("MD_ProgressCode", "014", "valid"),
+    ("MD_ProgressCode", "015", "accepted"),
+    ("MD_ProgressCode", "016", "notAccepted"),
+    ("MD_ProgressCode", "017", "withdrawn"),
+    ("MD_ProgressCode", "018", "deprecated"),
+    ("MD_RestrictionCode", "001", "copyright"),
+    ("MD_RestrictionCode", "002", "patent"),
+    ("MD_RestrictionCode", "003", "patentPending"),
+    ("MD_RestrictionCode", "004", "trademark"),
+    ("MD_RestrictionCode", "005", "license"),
+    ("MD_RestrictionCode", "006", "intellectualPropertyRights"),
+    ("MD_RestrictionCode", "007", "restricted"),
+    ("MD_RestrictionCode", "008", "otherRestrictions"),
+    ("MD_RestrictionCode", "009", "licenseUnrestricted"),
+    ("MD_RestrictionCode", "010", "licenseEndUser"),
+    ("MD_RestrictionCode", "011", "licenseDistributor"),
+    ("MD_RestrictionCode", "012", "privacy"),
+    ("MD_RestrictionCode", "013", "statutory"),
+    ("MD_RestrictionCode", "014", "confidential"),
+    ("MD_RestrictionCode", "015", "sensitivity/sensitiveButUnclassified"),
+    ("MD_RestrictionCode", "016", "unrestricted"),
+    ("MD_RestrictionCode", "017", "in-confidence"),
+    ("MD_ScopeCode", "001", "attribute"),
+    ("MD_ScopeCode", "002", "attributeType"),
+    ("MD_ScopeCode", "003", "collectionHardware"),
+    ("MD_ScopeCode", "004", "collectionSession"),
+    ("MD_ScopeCode", "005", "dataset"),
+    ("MD_ScopeCode", "006", "series"),
+    ("MD_ScopeCode", "007", "nonGeographicDataset"),
+    ("MD_ScopeCode", "008", "dimensionGroup"),
+    ("MD_ScopeCode", "009", "feature"),
+    ("MD_ScopeCode", "010", "featureType"),
+    ("MD_ScopeCode", "011", "propertyType"),
+    ("MD_ScopeCode", "012", "fieldSession"),
+    ("MD_ScopeCode", "013", "software"),
+    ("MD_ScopeCode", "014", "service"),
+    ("MD_ScopeCode", "015", "model"),
+    ("MD_ScopeCode", "016", "tile"),
+    ("MD_ScopeCode", "017", "initiative"),
+    ("MD_ScopeCode", "018", "stereomate"),
+    ("MD_ScopeCode", "019", "sensor"),
+    ("MD_ScopeCode", "020", "platformSeries"),
+    ("MD_ScopeCode", "021", "sensorSeries"),
+    ("MD_ScopeCode", "022", "productionSeries"),
+    ("MD_ScopeCode", "023", "transferAggregate"),
+    ("MD_ScopeCode", "024", "otherAggregate"),
+    ("MD_ScopeCode", "025", "metadata"),
+    ("MD_ScopeCode", "026", "sample"),
+    ("MD_ScopeCode", "027", "document"),
+    ("MD_ScopeCode", "028", "repository"),
+    ("MD_ScopeCode", "029", "aggregate"),
+    ("MD_ScopeCode", "030", "product"),
+    ("MD_ScopeCode", "031", "collection"),
+    ("MD_ScopeCode", "032", "coverage"),
+    ("MD_ScopeCode", "033", "application"),
+    ("MD_SpatialRepresentationTypeCode", "001", "vector"),
+    ("MD_SpatialRepresentationTypeCode", "002", "grid"),
+    ("MD_SpatialRepresentationTypeCode", "003", "textTable"),
+    ("MD_SpatialRepresentationTypeCode", "004", "tin"),
+    ("MD_SpatialRepresentationTypeCode", "005", "stereoModel"),
+    ("MD_SpatialRepresentationTypeCode", "006", "video"),
+    ("MD_TopicCategoryCode", "001", "farming"),
+    ("MD_TopicCategoryCode", "002", "biota"),
+    ("MD_TopicCategoryCode", "003", "boundaries"),
+    ("MD_TopicCategoryCode", "004", "climatologyMeteorologyAtmosphere"),
+    ("MD_TopicCategoryCode", "005", "economy"),
+    ("MD_TopicCategoryCode", "006", "elevation"),
+    ("MD_TopicCategoryCode", "007", "environment"),
+    ("MD_TopicCategoryCode", "008", "geoscientificInformation"),
+    ("MD_TopicCategoryCode", "009", "health"),
+    ("MD_TopicCategoryCode", "010", "imageryBaseMapsEarthCover"),
+    ("MD_TopicCategoryCode", "011", "intelligenceMilitary"),
+    ("MD_TopicCategoryCode", "012", "inlandWaters"),
+    ("MD_TopicCategoryCode", "013", "location"),
+    ("MD_TopicCategoryCode", "014", "oceans"),
+    ("MD_TopicCategoryCode", "015", "planningCadastre"),
+    ("MD_TopicCategoryCode", "016", "society"),
+    ("MD_TopicCategoryCode", "017", "structure"),
+    ("MD_TopicCategoryCode", "018", "transportation"),
+    ("MD_TopicCategoryCode", "019", "utilitiesCommunication"),
+    ("MD_TopicCategoryCode", "020", "extraTerrestrial"),
+    ("MD_TopicCategoryCode", "021", "disaster"),
+    ("MD_TopologyLevelCode", "001", "geometryOnly"),
+    ("MD_TopologyLevelCode", "002", "topology1D"),
+    ("MD_TopologyLevelCode", "003", "planarGraph"),
+    ("MD_TopologyLevelCode", "004", "fullPlanarGraph"),
+    ("MD_TopologyLevelCode", "005", "surfaceGraph"),
+    ("MD_TopologyLevelCode", "006", "fullSurfaceGraph"),
+    ("MD_TopologyLevelCode", "007", "topology3D"),
+    ("MD_TopologyLevelCode", "008", "fullTopology3D"),
+    ("MD_TopologyLevelCode", "009", "abstract"),
+    ("MD_CharacterSetCode", "001", "ucs2"),
+    ("MD_CharacterSetCode", "002", "ucs4"),
+    ("MD_CharacterSetCode", "003", "utf7"),
+    ("MD_CharacterSetCode", "004", "utf8"),
+    ("MD_CharacterSetCode", "005", "utf16"),
+    ("MD_CharacterSetCode", "006", "8859part1"),
+    ("MD_CharacterSetCode", "007", "8859part2"),
+    ("MD_CharacterSetCode", "008", "8859part3"),
+    ("MD_CharacterSetCode", "009", "8859part4"),
+    ("MD_CharacterSetCode", "010", "8859part5"),
+    ("MD_CharacterSetCode", "011", "8859part6"),
+    ("MD_CharacterSetCode", "012", "8859part7"),
+    ("MD_CharacterSetCode", "013", "8859part8"),
+    ("MD_CharacterSetCode", "014", "8859part9"),
+    ("MD_CharacterSetCode", "015", "8859part10"),
+    ("MD_CharacterSetCode", "016", "8859part11"),
+    ("MD_CharacterSetCode", "017", "(reserved for future use)"),
+    ("MD_CharacterSetCode", "018", "8859part13"),
+    ("MD_CharacterSetCode", "019", "8859part14"),
+    ("MD_CharacterSetCode", "020", "8859part15"),
+    ("MD_CharacterSetCode", "021", "8859part16"),
+    ("MD_CharacterSetCode", "022", "jis"),
+    ("MD_CharacterSetCode", "023", "shiftJIS"),
+    ("MD_CharacterSetCode", "024", "eucJP"),
+    ("MD_CharacterSetCode", "025", "usAscii"),
+    ("MD_CharacterSetCode", "026", "ebcdic"),
+    ("MD_CharacterSetCode", "027", "eucKR"),
+    ("MD_CharacterSetCode", "028", "big5"),
+    ("MD_CharacterSetCode", "029", "GB2312"),
+    ("MD_GeometricObjectTypeCode", "001", "complex"),
+    ("MD_GeometricObjectTypeCode", "002", "composite"),
+    ("MD_GeometricObjectTypeCode", "003", "curve"),
+    ("MD_GeometricObjectTypeCode", "004", "point"),
+    ("MD_GeometricObjectTypeCode", "005", "solid"),
+    ("MD_GeometricObjectTypeCode", "006", "surface"),
+)
+
+
 def _get_inlined_arcgis_coded_values():
+    """Return the inlined coded values (a shared immutable tuple)."""
+    return _INLINED_ARCGIS_CODED_VALUES
+
+
+def _build_by_num_from_arcgis(codelist_name, by_name):
     """
-    Inlined (codelist_name, arc_code, std_code) from https://github.com/Esri/arcgis-pro-metadata-toolkit/tree/master/resourcesArcGIS Metadata Details 20211130.xlsx
-    so by_num can be built without requiring the Excel file. Used when the file is not present.
-    """
-    return [
-        ("CI_PresentationFormCode", "001", "documentDigital"),
-        ("CI_PresentationFormCode", "002", "documentHardcopy"),
-        ("CI_PresentationFormCode", "003", "imageDigital"),
-        ("CI_PresentationFormCode", "004", "imageHardcopy"),
-        ("CI_PresentationFormCode", "005", "mapDigital"),
-        ("CI_PresentationFormCode", "006", "mapHardcopy"),
-        ("CI_PresentationFormCode", "007", "modelDigital"),
-        ("CI_PresentationFormCode", "008", "modelHardcopy"),
-        ("CI_PresentationFormCode", "009", "profileDigital"),
-        ("CI_PresentationFormCode", "010", "profileHardcopy"),
-        ("CI_PresentationFormCode", "011", "tableDigital"),
-        ("CI_PresentationFormCode", "012", "tableHardcopy"),
-        ("CI_PresentationFormCode", "013", "videoDigital"),
-        ("CI_PresentationFormCode", "014", "videoHardcopy"),
-        ("CI_PresentationFormCode", "015", "audioDigital"),
-        ("CI_PresentationFormCode", "016", "audioHardcopy"),
-        ("CI_PresentationFormCode", "017", "multimediaDigital"),
-        ("CI_PresentationFormCode", "018", "multimediaHardcopy"),
-        ("CI_PresentationFormCode", "019", "diagramDigital"),
-        ("CI_PresentationFormCode", "020", "diagramHardcopy"),
-        ("CI_PresentationFormCode", "021", "physicalObject"),
-        ("CI_RoleCode", "001", "resourceProvider"),
-        ("CI_RoleCode", "002", "custodian"),
-        ("CI_RoleCode", "003", "owner"),
-        ("CI_RoleCode", "004", "user"),
-        ("CI_RoleCode", "005", "distributor"),
-        ("CI_RoleCode", "006", "originator"),
-        ("CI_RoleCode", "007", "pointOfContact"),
-        ("CI_RoleCode", "008", "principalInvestigator"),
-        ("CI_RoleCode", "009", "processor"),
-        ("CI_RoleCode", "010", "publisher"),
-        ("CI_RoleCode", "011", "author"),
-        ("CI_RoleCode", "012", "collaborator"),
-        ("CI_RoleCode", "013", "editor"),
-        ("CI_RoleCode", "014", "mediator"),
-        ("CI_RoleCode", "015", "rightsHolder"),
-        ("CI_RoleCode", "016", "sponsor"),
-        ("CI_RoleCode", "017", "coAuthor"),
-        ("CI_RoleCode", "018", "contributor"),
-        ("CI_RoleCode", "019", "funder"),
-        ("CI_RoleCode", "020", "stakeholder"),
-        ("MD_MaintenanceFrequencyCode", "001", "continual"),
-        ("MD_MaintenanceFrequencyCode", "002", "daily"),
-        ("MD_MaintenanceFrequencyCode", "003", "weekly"),
-        ("MD_MaintenanceFrequencyCode", "004", "fortnightly"),
-        ("MD_MaintenanceFrequencyCode", "005", "monthly"),
-        ("MD_MaintenanceFrequencyCode", "006", "quarterly"),
-        ("MD_MaintenanceFrequencyCode", "007", "biannually"),
-        ("MD_MaintenanceFrequencyCode", "008", "annually"),
-        ("MD_MaintenanceFrequencyCode", "009", "asNeeded"),
-        ("MD_MaintenanceFrequencyCode", "010", "irregular"),
-        ("MD_MaintenanceFrequencyCode", "011", "notPlanned"),
-        ("MD_MaintenanceFrequencyCode", "012", "unknown"),
-        ("MD_MaintenanceFrequencyCode", "013", "semimonthly"),
-        ("MD_MaintenanceFrequencyCode", "014", "periodic"),
-        ("MD_MaintenanceFrequencyCode", "015", "biennially"),
-        ("MD_ProgressCode", "001", "completed"),
-        ("MD_ProgressCode", "002", "historicalArchive"),
-        ("MD_ProgressCode", "003", "obsolete"),
-        ("MD_ProgressCode", "004", "onGoing"),
-        ("MD_ProgressCode", "005", "planned"),
-        ("MD_ProgressCode", "006", "required"),
-        ("MD_ProgressCode", "007", "underDevelopment"),
-        ("MD_ProgressCode", "008", "proposed"),
-        ("MD_ProgressCode", "009", "final"),
-        ("MD_ProgressCode", "010", "pending"),
-        ("MD_ProgressCode", "011", "retired"),
-        ("MD_ProgressCode", "012", "superseded"),
-        ("MD_ProgressCode", "013", "tentative"),
-        ("MD_ProgressCode", "014", "valid"),
-        ("MD_ProgressCode", "015", "accepted"),
-        ("MD_ProgressCode", "016", "notAccepted"),
-        ("MD_ProgressCode", "017", "withdrawn"),
-        ("MD_ProgressCode", "018", "deprecated"),
-        ("MD_RestrictionCode", "001", "copyright"),
-        ("MD_RestrictionCode", "002", "patent"),
-        ("MD_RestrictionCode", "003", "patentPending"),
-        ("MD_RestrictionCode", "004", "trademark"),
-        ("MD_RestrictionCode", "005", "license"),
-        ("MD_RestrictionCode", "006", "intellectualPropertyRights"),
-        ("MD_RestrictionCode", "007", "restricted"),
-        ("MD_RestrictionCode", "008", "otherRestrictions"),
-        ("MD_RestrictionCode", "009", "licenseUnrestricted"),
-        ("MD_RestrictionCode", "010", "licenseEndUser"),
-        ("MD_RestrictionCode", "011", "licenseDistributor"),
-        ("MD_RestrictionCode", "012", "privacy"),
-        ("MD_RestrictionCode", "013", "statutory"),
-        ("MD_RestrictionCode", "014", "confidential"),
-        ("MD_RestrictionCode", "015", "sensitivity/sensitiveButUnclassified"),
-        ("MD_RestrictionCode", "016", "unrestricted"),
-        ("MD_RestrictionCode", "017", "in-confidence"),
-        ("MD_ScopeCode", "001", "attribute"),
-        ("MD_ScopeCode", "002", "attributeType"),
-        ("MD_ScopeCode", "003", "collectionHardware"),
-        ("MD_ScopeCode", "004", "collectionSession"),
-        ("MD_ScopeCode", "005", "dataset"),
-        ("MD_ScopeCode", "006", "series"),
-        ("MD_ScopeCode", "007", "nonGeographicDataset"),
-        ("MD_ScopeCode", "008", "dimensionGroup"),
-        ("MD_ScopeCode", "009", "feature"),
-        ("MD_ScopeCode", "010", "featureType"),
-        ("MD_ScopeCode", "011", "propertyType"),
-        ("MD_ScopeCode", "012", "fieldSession"),
-        ("MD_ScopeCode", "013", "software"),
-        ("MD_ScopeCode", "014", "service"),
-        ("MD_ScopeCode", "015", "model"),
-        ("MD_ScopeCode", "016", "tile"),
-        ("MD_ScopeCode", "017", "initiative"),
-        ("MD_ScopeCode", "018", "stereomate"),
-        ("MD_ScopeCode", "019", "sensor"),
-        ("MD_ScopeCode", "020", "platformSeries"),
-        ("MD_ScopeCode", "021", "sensorSeries"),
-        ("MD_ScopeCode", "022", "productionSeries"),
-        ("MD_ScopeCode", "023", "transferAggregate"),
-        ("MD_ScopeCode", "024", "otherAggregate"),
-        ("MD_ScopeCode", "025", "metadata"),
-        ("MD_ScopeCode", "026", "sample"),
-        ("MD_ScopeCode", "027", "document"),
-        ("MD_ScopeCode", "028", "repository"),
-        ("MD_ScopeCode", "029", "aggregate"),
-        ("MD_ScopeCode", "030", "product"),
-        ("MD_ScopeCode", "031", "collection"),
-        ("MD_ScopeCode", "032", "coverage"),
-        ("MD_ScopeCode", "033", "application"),
-        ("MD_SpatialRepresentationTypeCode", "001", "vector"),
-        ("MD_SpatialRepresentationTypeCode", "002", "grid"),
-        ("MD_SpatialRepresentationTypeCode", "003", "textTable"),
-        ("MD_SpatialRepresentationTypeCode", "004", "tin"),
-        ("MD_SpatialRepresentationTypeCode", "005", "stereoModel"),
-        ("MD_SpatialRepresentationTypeCode", "006", "video"),
-        ("MD_TopicCategoryCode", "001", "farming"),
-        ("MD_TopicCategoryCode", "002", "biota"),
-        ("MD_TopicCategoryCode", "003", "boundaries"),
-        ("MD_TopicCategoryCode", "004", "climatologyMeteorologyAtmosphere"),
-        ("MD_TopicCategoryCode", "005", "economy"),
-        ("MD_TopicCategoryCode", "006", "elevation"),
-        ("MD_TopicCategoryCode", "007", "environment"),
-        ("MD_TopicCategoryCode", "008", "geoscientificInformation"),
-        ("MD_TopicCategoryCode", "009", "health"),
-        ("MD_TopicCategoryCode", "010", "imageryBaseMapsEarthCover"),
-        ("MD_TopicCategoryCode", "011", "intelligenceMilitary"),
-        ("MD_TopicCategoryCode", "012", "inlandWaters"),
-        ("MD_TopicCategoryCode", "013", "location"),
-        ("MD_TopicCategoryCode", "014", "oceans"),
-        ("MD_TopicCategoryCode", "015", "planningCadastre"),
-        ("MD_TopicCategoryCode", "016", "society"),
-        ("MD_TopicCategoryCode", "017", "structure"),
-        ("MD_TopicCategoryCode", "018", "transportation"),
-        ("MD_TopicCategoryCode", "019", "utilitiesCommunication"),
-        ("MD_TopicCategoryCode", "020", "extraTerrestrial"),
-        ("MD_TopicCategoryCode", "021", "disaster"),
-        ("MD_TopologyLevelCode", "001", "geometryOnly"),
-        ("MD_TopologyLevelCode", "002", "topology1D"),
-        ("MD_TopologyLevelCode", "003", "planarGraph"),
-        ("MD_TopologyLevelCode", "004", "fullPlanarGraph"),
-        ("MD_TopologyLevelCode", "005", "surfaceGraph"),
-        ("MD_TopologyLevelCode", "006", "fullSurfaceGraph"),
-        ("MD_TopologyLevelCode", "007", "topology3D"),
-        ("MD_TopologyLevelCode", "008", "fullTopology3D"),
-        ("MD_TopologyLevelCode", "009", "abstract"),
-        ("MD_CharacterSetCode", "001", "ucs2"),
-        ("MD_CharacterSetCode", "002", "ucs4"),
-        ("MD_CharacterSetCode", "003", "utf7"),
-        ("MD_CharacterSetCode", "004", "utf8"),
-        ("MD_CharacterSetCode", "005", "utf16"),
-        ("MD_CharacterSetCode", "006", "8859part1"),
-        ("MD_CharacterSetCode", "007", "8859part2"),
-        ("MD_CharacterSetCode", "008", "8859part3"),
-        ("MD_CharacterSetCode", "009", "8859part4"),
-        ("MD_CharacterSetCode", "010", "8859part5"),
-        ("MD_CharacterSetCode", "011", "8859part6"),
-        ("MD_CharacterSetCode", "012", "8859part7"),
-        ("MD_CharacterSetCode", "013", "8859part8"),
-        ("MD_CharacterSetCode", "014", "8859part9"),
-        ("MD_CharacterSetCode", "015", "8859part10"),
-        ("MD_CharacterSetCode", "016", "8859part11"),
-        ("MD_CharacterSetCode", "017", "(reserved for future use)"),
-        ("MD_CharacterSetCode", "018", "8859part13"),
-        ("MD_CharacterSetCode", "019", "8859part14"),
-        ("MD_CharacterSetCode", "020", "8859part15"),
-        ("MD_CharacterSetCode", "021", "8859part16"),
-        ("MD_CharacterSetCode", "022", "jis"),
-        ("MD_CharacterSetCode", "023", "shiftJIS"),
-        ("MD_CharacterSetCode", "024", "eucJP"),
-        ("MD_CharacterSetCode", "025", "usAscii"),
-        ("MD_CharacterSetCode", "026", "ebcdic"),
-        ("MD_CharacterSetCode", "027", "eucKR"),
-        ("MD_CharacterSetCode", "028", "big5"),
-        ("MD_CharacterSetCode", "029", "GB2312"),
-        ("MD_GeometricObjectTypeCode", "001", "complex"),
-        ("MD_GeometricObjectTypeCode", "002", "composite"),
-        ("MD_GeometricObjectTypeCode", "003", "curve"),
-        ("MD_GeometricObjectTypeCode", "004", "point"),
-        ("MD_GeometricObjectTypeCode", "005", "solid"),
-        ("MD_GeometricObjectTypeCode", "006", "surface"),
-    ]
-
-
-def _build_by_num_from_arcgis(codelist_name, by_name, arcgis_coded_values):
-    """
-    Build by_num (int -> display label) from ArcGIS coded values list.
-    Uses by_name to resolve standard code to label; falls back to _format_code_as_label.
+    Build by_num (int -> display label) from the ArcGIS coded values for one
+    codelist. Uses by_name to resolve standard code to label; falls back to
+    _format_code_as_label.
     """
     by_num = {}
-    for name, arc_code, std_code in arcgis_coded_values:
-        if name != codelist_name:
-            continue
+    for arc_code, std_code in _ARCGIS_BY_CODELIST.get(codelist_name, ()):
         try:
             num = int(arc_code)
         except ValueError:
@@ -388,15 +427,32 @@ def _build_by_num_from_arcgis(codelist_name, by_name, arcgis_coded_values):
     return by_num
 
 
-# Resolve ArcGIS coded values once at import (Excel if present, else inlined).
-_ARCGIS_CODED_VALUES = _load_arcgis_coded_values_from_excel(
-    Path(__file__).parent / "ArcGIS Metadata Details 20211130.xlsx"
-) or _get_inlined_arcgis_coded_values()
-
-
-def _codelist_restriction():
+# Resolve ArcGIS coded values once at import, then bucket them by codelist so
+# each _codelist_* builds its by_num from its own entries instead of scanning
+# the whole ~170-tuple list. The inlined table already covers every codelist
+# the script ships with, so the Esri Excel file is only consulted when
+# LANDIS_USE_EXCEL_CODELIST is set — opening the workbook costs far more than
+# the rest of the import, which is paid again by every pool worker.
+if os.environ.get("LANDIS_USE_EXCEL_CODELIST"):
+    _ARCGIS_CODED_VALUES = _load_arcgis_coded_values_from_excel(
+        Path(__file__).parent / "ArcGIS Metadata Details 20211130.xlsx"
+    ) or _get_inlined_arcgis_coded_values()
+else:
+    _ARCGIS_CODED_VALUES = _get_inlined_arcgis_coded_values()
+
+_ARCGIS_BY_CODELIST = {}
+for _name, _arc_code, _std_code in _ARCGIS_CODED_VALUES:
+    _ARCGIS_BY_CODELIST.setdefault(_name, []).append((_arc_code, _std_code))
+del _name, _arc_code, _std_code
+
+
+# Codelist name -> by_name (normalised code name -> display label). Pure data:
+# the eleven near-identical _codelist_* builder functions are collapsed into
+# this one table, and each by_num map is derived from the ArcGIS coded values
+# in a single comprehension below.
+_CODELIST_BY_NAME = {
     # MD_RestrictionCode: limitation on access or use
-    by_name = {
+    "MD_RestrictionCode": {
         "copyright": "Copyright",
         "patent": "Patent",
         "patentpending": "Patent pending",
@@ -417,14 +473,9 @@ def _codelist_restriction():
         "sbu": "Sensitive but unclassified",
         "sensitivebutunclassified": "Sensitive but unclassified",
         "in-confidence": "In confidence",
-    }
-    by_num = _build_by_num_from_arcgis("MD_RestrictionCode", by_name, _ARCGIS_CODED_VALUES)
-    return by_name, by_num
-
-
-def _codelist_role():
+    },
     # CI_RoleCode: function performed by responsible party
-    by_name = {
+    "CI_RoleCode": {
         "resourceprovider": "Resource provider",
         "custodian": "Custodian",
         "owner": "Owner",
@@ -445,14 +496,9 @@ def _codelist_role():
         "contributor": "Contributor",
         "funder": "Funder",
         "stakeholder": "Stakeholder",
-    }
-    by_num = _build_by_num_from_arcgis("CI_RoleCode", by_name, _ARCGIS_CODED_VALUES)
-    return by_name, by_num
-
-
-def _codelist_progress():
+    },
     # MD_ProgressCode: status of the dataset
-    by_name = {
+    "MD_ProgressCode": {
         "completed": "Completed",
         "historicalarchive": "Historical archive",
         "obsolete": "Obsolete",
@@ -471,14 +517,9 @@ def _codelist_progress():
         "withdrawn": "Withdrawn",
         "proposed": "Proposed",
         "deprecated": "Deprecated",
-    }
-    by_num = _build_by_num_from_arcgis("MD_ProgressCode", by_name, _ARCGIS_CODED_VALUES)
-    return by_name, by_num
-
-
-def _codelist_maintenance_frequency():
+    },
     # MD_MaintenanceFrequencyCode
-    by_name = {
+    "MD_MaintenanceFrequencyCode": {
         "continual": "Continual",
         "daily": "Daily",
         "weekly": "Weekly",
@@ -494,16 +535,9 @@ def _codelist_maintenance_frequency():
         "semimonthly": "Semi-monthly",
         "periodic": "Periodic",
         "biennially": "Biennially",
-    }
-    by_num = _build_by_num_from_arcgis(
-        "MD_MaintenanceFrequencyCode", by_name, _ARCGIS_CODED_VALUES
-    )
-    return by_name, by_num
-
-
-def _codelist_topic_category():
+    },
     # MD_TopicCategoryCode (high-level thematic classification)
-    by_name = {
+    "MD_TopicCategoryCode": {
         "farming": "Farming",
         "biota": "Biota",
         "boundaries": "Boundaries",
@@ -525,16 +559,9 @@ def _codelist_topic_category():
         "utilitiescommunication": "Utilities, communication",
         "extraterrestrial": "Extra-terrestrial",
         "disaster": "Disaster",
-    }
-    by_num = _build_by_num_from_arcgis(
-        "MD_TopicCategoryCode", by_name, _ARCGIS_CODED_VALUES
-    )
-    return by_name, by_num
-
-
-def _codelist_scope():
+    },
     # MD_ScopeCode: class of information
-    by_name = {
+    "MD_ScopeCode": {
         "attribute": "Attribute",
         "attributetype": "Attribute type",
         "collectionhardware": "Collection hardware",
@@ -568,14 +595,9 @@ def _codelist_scope():
         "productionseries": "Production series",
         "transferaggregate": "Transfer aggregate",
         "otheraggregate": "Other aggregate",
-    }
-    by_num = _build_by_num_from_arcgis("MD_ScopeCode", by_name, _ARCGIS_CODED_VALUES)
-    return by_name, by_num
-
-
-def _codelist_character_set():
+    },
     # MD_CharacterSetCode
-    by_name = {
+    "MD_CharacterSetCode": {
         "ucs2": "UCS-2",
         "ucs4": "UCS-4",
         "utf7": "UTF-7",
@@ -604,32 +626,18 @@ def _codelist_character_set():
         "euckr": "EUC-KR",
         "big5": "Big 5",
         "gb2312": "GB 2312",
-    }
-    by_num = _build_by_num_from_arcgis(
-        "MD_CharacterSetCode", by_name, _ARCGIS_CODED_VALUES
-    )
-    return by_name, by_num
-
-
-def _codelist_spatial_representation():
+    },
     # MD_SpatialRepresentationTypeCode
-    by_name = {
+    "MD_SpatialRepresentationTypeCode": {
         "vector": "Vector",
         "grid": "Grid",
         "texttable": "Text, table",
         "tin": "TIN",
         "stereomodel": "Stereo model",
         "video": "Video",
-    }
-    by_num = _build_by_num_from_arcgis(
-        "MD_SpatialRepresentationTypeCode", by_name, _ARCGIS_CODED_VALUES
-    )
-    return by_name, by_num
-
-
-def _codelist_topology_level():
+    },
     # MD_TopologyLevelCode
-    by_name = {
+    "MD_TopologyLevelCode": {
         "geometryonly": "Geometry only",
         "topology1d": "Topology 1D",
         "planargraph": "Planar graph",
@@ -639,16 +647,9 @@ def _codelist_topology_level():
         "topology3d": "Topology 3D",
         "fulltopology3d": "Full topology 3D",
         "abstract": "Abstract",
-    }
-    by_num = _build_by_num_from_arcgis(
-        "MD_TopologyLevelCode", by_name, _ARCGIS_CODED_VALUES
-    )
-    return by_name, by_num
-
-
-def _codelist_presentation_form():
+    },
     # CI_PresentationFormCode
-    by_name = {
+    "CI_PresentationFormCode": {
         "documentdigital": "Document (digital)",
         "documenthardcopy": "Document (hard copy)",
         "imagedigital": "Image (digital)",
@@ -670,32 +671,18 @@ def _codelist_presentation_form():
         "diagramdigital": "Diagram (digital)",
         "diagramhardcopy": "Diagram (hard copy)",
         "physicalobject": "Physical object",
-    }
-    by_num = _build_by_num_from_arcgis(
-        "CI_PresentationFormCode", by_name, _ARCGIS_CODED_VALUES
-    )
-    return by_name, by_num
-
-
-def _codelist_geometric_object_type():
+    },
     # MD_GeometricObjectTypeCode (geometry type of features)
-    by_name = {
+    "MD_GeometricObjectTypeCode": {
         "complex": "Complex",
         "composite": "Composite",
         "curve": "Curve",
         "point": "Point",
         "solid": "Solid",
         "surface": "Surface",
-    }
-    by_num = _build_by_num_from_arcgis(
-        "MD_GeometricObjectTypeCode", by_name, _ARCGIS_CODED_VALUES
-    )
-    return by_name, by_num
-
-
-def _codelist_content_type():
+    },
     # ArcGIS item content type (imsContentType); from Esri DTD comment.
-    by_name = {
+    "ArcGIS_ContentTypeCode": {
         "livedataandmaps": "Live Data and Maps",
         "downloadabledata": "Downloadable Data",
         "offlinedata": "Offline Data",
@@ -706,8 +693,18 @@ def _codelist_content_type():
         "clearinghouses": "Clearinghouses",
         "mapfiles": "Map Files",
         "geographicactivities": "Geographic Activities",
-    }
-    by_num = {
+    },
+}
+
+# Code labels repeat across files and cells; keep one interned copy of each.
+for _labels in _CODELIST_BY_NAME.values():
+    for _key in _labels:
+        _labels[_key] = sys.intern(_labels[_key])
+del _labels, _key
+
+# ArcGIS item content type is not in the Esri coded-values table; its numeric
+# codes come straight from the Esri DTD comment.
+_CONTENT_TYPE_BY_NUM = {
         1: "Live Data and Maps",
         2: "Downloadable Data",
         3: "Offline Data",
@@ -718,46 +715,55 @@ def _codelist_content_type():
         8: "Clearinghouses",
         9: "Map Files",
         10: "Geographic Activities",
-    }
-    return by_name, by_num
+}
 
 
 # Codelist registry: name -> (by_name dict, by_num dict)
 _CODELISTS = {
-    "MD_RestrictionCode": _codelist_restriction(),
-    "CI_RoleCode": _codelist_role(),
-    "MD_ProgressCode": _codelist_progress(),
-    "MD_MaintenanceFrequencyCode": _codelist_maintenance_frequency(),
-    "MD_TopicCategoryCode": _codelist_topic_category(),
-    "MD_ScopeCode": _codelist_scope(),
-    "MD_CharacterSetCode": _codelist_character_set(),
-    "MD_SpatialRepresentationTypeCode": _codelist_spatial_representation(),
-    "MD_TopologyLevelCode": _codelist_topology_level(),
-    "CI_PresentationFormCode": _codelist_presentation_form(),
-    "MD_GeometricObjectTypeCode": _codelist_geometric_object_type(),
-    "ArcGIS_ContentTypeCode": _codelist_content_type(),
+    name: (by_name, _build_by_num_from_arcgis(name, by_name))
+    for name, by_name in _CODELIST_BY_NAME.items()
+}
+_CODELISTS["ArcGIS_ContentTypeCode"] = (
+    _CODELIST_BY_NAME["ArcGIS_ContentTypeCode"], _CONTENT_TYPE_BY_NUM
+)
+
+# Consolidated code index: one flat dict keyed (codelist name, normalised code
+# name or numeric code) -> label, built once from _CODELISTS so that
+# resolve_codelist needs a single hash lookup per value instead of picking a
+# codelist dict first. Name and numeric keys cannot collide (str vs int).
+_CODE_INDEX = {}
+for _cl_name, (_cl_by_name, _cl_by_num) in _CODELISTS.items():
+    for _code_key, _label in _cl_by_name.items():
+        _CODE_INDEX[(_cl_name, _code_key)] = _label
+    for _code_num, _label in _cl_by_num.items():
+        _CODE_INDEX[(_cl_name, _code_num)] = _label
+del _cl_name, _cl_by_name, _cl_by_num, _code_key, _code_num, _label
+
+# Pre-bound lookups for the per-field hot path (skips an attribute load per call).
+_CODE_INDEX_GET = _CODE_INDEX.get
+_FIELD_OBLIGATION_GET = FIELD_OBLIGATION.get
+
+# Export fields that are resolved via codelists (for the Code resolution
+# worksheet). Maps export field name -> codelist name; insertion order drives
+# the worksheet row order.
+FIELD_TO_CODELIST = {
+    "Access Constraints": "MD_RestrictionCode",
+    "Presentation Form": "CI_PresentationFormCode",
+    "Character Set": "MD_CharacterSetCode",
+    "Spatial Representation Type": "MD_SpatialRepresentationTypeCode",
+    "Status": "MD_ProgressCode",
+    "Maintenance Frequency": "MD_MaintenanceFrequencyCode",
+    "Topic Category": "MD_TopicCategoryCode",
+    "Contact Role": "CI_RoleCode",
+    "Topology Level": "MD_TopologyLevelCode",
+    "Geometry Object Type": "MD_GeometricObjectTypeCode",
+    "Feature Geometry Code": "MD_GeometricObjectTypeCode",
+    "Data Quality Scope Level": "MD_ScopeCode",
+    "Metadata Maintenance Frequency": "MD_MaintenanceFrequencyCode",
+    "Metadata Scope Code": "MD_ScopeCode",
+    "Metadata Character Set": "MD_CharacterSetCode",
+    "Content Type": "ArcGIS_ContentTypeCode",
 }
-
-# Export fields that are resolved via codelists (for the Code resolution worksheet).
-# Order: (Export field name, Codelist name).
-FIELD_TO_CODELIST = [
-    ("Access Constraints", "MD_RestrictionCode"),
-    ("Presentation Form", "CI_PresentationFormCode"),
-    ("Character Set", "MD_CharacterSetCode"),
-    ("Spatial Representation Type", "MD_SpatialRepresentationTypeCode"),
-    ("Status", "MD_ProgressCode"),
-    ("Maintenance Frequency", "MD_MaintenanceFrequencyCode"),
-    ("Topic Category", "MD_TopicCategoryCode"),
-    ("Contact Role", "CI_RoleCode"),
-    ("Topology Level", "MD_TopologyLevelCode"),
-    ("Geometry Object Type", "MD_GeometricObjectTypeCode"),
-    ("Feature Geometry Code", "MD_GeometricObjectTypeCode"),
-    ("Data Quality Scope Level", "MD_ScopeCode"),
-    ("Metadata Maintenance Frequency", "MD_MaintenanceFrequencyCode"),
-    ("Metadata Scope Code", "MD_ScopeCode"),
-    ("Metadata Character Set", "MD_CharacterSetCode"),
-    ("Content Type", "ArcGIS_ContentTypeCode"),
-]
 
 
 def get_codelist_resolution_table():
@@ -773,41 +779,44 @@ def get_codelist_resolution_table():
     return rows
 
 
+@functools.lru_cache(maxsize=2048)
 def resolve_codelist(raw_value, codelist_name):
     """
     Return a human-readable label for an ISO 19139 codelist value.
 
+    Memoised: the same (value, codelist) pairs recur across every file in a
+    folder (languages, restriction codes), and the resolution tables never
+    change after import.
+
     ArcGIS often stores a numeric code (e.g. "005" for licence); standard ISO may
     use the code name (e.g. "license"). If the value is recognised, returns the
     label; otherwise returns the original value unchanged.
 
     Args:
-        raw_value: The 'value' or 'codeListValue' from the XML (e.g. "005", "license").
+        raw_value: The 'value' or 'codeListValue' from the XML (e.g. "005",
+                   "license"). Must be a string; callers pass "" when absent.
         codelist_name: One of the keys in _CODELISTS (e.g. "MD_RestrictionCode").
 
     Returns:
         Display string (e.g. "Licence") or raw_value if not found.
     """
-    if not raw_value or not isinstance(raw_value, str):
-        return raw_value or ""
+    if not raw_value:
+        return ""
     raw = raw_value.strip()
     if not raw:
         return ""
     if codelist_name not in _CODELISTS:
         return raw
-    by_name, by_num = _CODELISTS[codelist_name]
+    # ArcGIS usually stores the numeric form ("005"); try it first so digit
+    # values skip the name normalisation below (isdecimal guarantees int()
+    # succeeds, so no try/except is needed).
+    if raw.isdecimal():
+        label = _CODE_INDEX_GET((codelist_name, int(raw)))
+        if label is not None:
+            return label
     # Try as name (case-insensitive, no spaces/hyphens)
-    key = re.sub(r"[\s\-]", "", raw).lower()
-    if key in by_name:
-        return by_name[key]
-    # Try as integer (strip leading zeros for lookup)
-    try:
-        n = int(raw)
-        if n in by_num:
-            return by_num[n]
-    except ValueError:
-        pass
-    return raw
+    label = _CODE_INDEX_GET((codelist_name, raw.translate(_CODE_KEY_DEL).lower()))
+    return label if label is not None else raw
 
 
 def get_field_obligation(field_name):
@@ -825,11 +834,18 @@ def get_field_obligation(field_name):
     Returns:
         One of "mandatory", "optional", or "conditional".
     """
-    if field_name in FIELD_OBLIGATION:
-        return FIELD_OBLIGATION[field_name]
-    if field_name.startswith("Other Keywords ("):
-        return "optional"
-    return "optional"
+    return _FIELD_OBLIGATION_GET(field_name, "optional")
+
+
+# Compiled once: clean_text runs for every text node extracted, and going
+# through re.sub's pattern-cache lookup each call adds up.
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+@functools.lru_cache(maxsize=4096)
+def _unescape(text):
+    """Memoised html.unescape for the short tokens metadata repeats endlessly."""
+    return html.unescape(text)
 
 
 def clean_text(text):
@@ -845,13 +861,16 @@ def clean_text(text):
     """
     if text is None:
         return ""
-    # Decode HTML entities
-    text = html.unescape(text)
+    # Fast path: most values (coordinates, dates, codes) contain no markup or
+    # entities, so skip the unescape and regex scans entirely.
+    if '<' not in text and '&' not in text:
+        return ' '.join(text.split())
+    # Decode HTML entities (cache short values; long abstracts rarely repeat)
+    text = _unescape(text) if len(text) <= 256 else html.unescape(text)
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Clean up whitespace
-    text = ' '.join(text.split())
-    return text.strip()
+    text = _HTML_TAG_RE.sub('', text)
+    # Clean up whitespace (split() also trims the ends)
+    return ' '.join(text.split())
 
 
 def get_text(element, default=""):
@@ -870,12 +889,15 @@ def get_text(element, default=""):
     """
     if element is None:
         return default
-    if element.text:
-        return clean_text(element.text)
-    # Get all text content including nested elements
+    t = element.text
+    if t:
+        # Inlined clean_text fast path: most leaf values carry no markup or
+        # entities, so collapse whitespace here and skip the call entirely.
+        if '<' not in t and '&' not in t:
+            return ' '.join(t.split())
+        return clean_text(t)
+    # No direct text: concatenate text from nested children
     text_parts = []
-    if element.text:
-        text_parts.append(element.text.strip())
     for child in element:
         if child.text:
             text_parts.append(child.text.strip())
@@ -901,447 +923,517 @@ def get_attribute_value(element, attr_name, default=""):
     return element.get(attr_name, default)
 
 
+def _codelist_attr(element):
+    """
+    Return a codelist element's code from its 'value' (ArcGIS) or
+    'codeListValue' (ISO) attribute, reading the attribute dict once.
+
+    Args:
+        element: The code element (e.g. RestrictCd, CharSetCd); not None.
+
+    Returns:
+        The code string, or "" if neither attribute is present.
+    """
+    attrib = element.attrib
+    return attrib.get('value') or attrib.get('codeListValue') or ""
+
+
+def _index_tree(root):
+    """
+    Index a parsed tree by tag in a single walk.
+
+    extract_all_fields looks up each top-level section with root.find('.//tag'),
+    and every such call re-walks the whole tree. One linear pass recording the
+    first element seen per tag (document order, i.e. what find('.//tag') would
+    return) turns those scans into dict lookups.
+
+    Args:
+        root: The root Element of the parsed XML.
+
+    Returns:
+        Dict mapping tag name to the first element with that tag below root.
+    """
+    first = {}
+    setdefault = first.setdefault
+    for el in root.iter():
+        tag = el.tag
+        if isinstance(tag, str):  # lxml's iter() also yields comments/PIs
+            setdefault(tag, el)
+    return first
+
+
+# ---------------------------------------------------------------------------
+# Field specs for extract_all_fields. Most fields follow one of three shapes —
+# element text, a codelist element's value/codeListValue attribute resolved to
+# a label, or a plain 'value' attribute — so each section lists its fields as
+# (relative path, export name[, codelist]) tuples and a shared loop does the
+# work. Fields needing bespoke handling (keyword joins, report type, Esri
+# feature terms) stay inline in extract_all_fields.
+# ---------------------------------------------------------------------------
+
+_ESRI_TEXT = (
+    ('ArcGISFormat', 'ArcGIS Format'),
+    ('ArcGISProfile', 'ArcGIS Profile'),
+    ('CreaDate', 'Creation Date'),
+    ('CreaTime', 'Creation Time'),
+    ('ModDate', 'Modification Date'),
+    ('ModTime', 'Modification Time'),
+)
+_NATIVE_EXT_TEXT = (
+    ('westBL', 'West Bounding Longitude'),
+    ('eastBL', 'East Bounding Longitude'),
+    ('southBL', 'South Bounding Latitude'),
+    ('northBL', 'North Bounding Latitude'),
+)
+_COORD_REF_TEXT = (
+    ('type', 'Coordinate System Type'),
+    ('geogcsn', 'Geographic CS Name'),
+    ('projcsn', 'Projected CS Name'),
+    ('csUnits', 'Coordinate System Units'),
+)
+_SCALE_RANGE_TEXT = (
+    ('minScale', 'Minimum Scale'),
+    ('maxScale', 'Maximum Scale'),
+)
+_CITATION_TEXT = (
+    ('resTitle', 'Resource Title'),
+    ('resAltTitle', 'Resource Alternative Title'),
+    ('collTitle', 'Collection Title'),
+    ('.//date/pubDate', 'Publication Date'),
+)
+_GEO_BBOX_TEXT = (
+    ('westBL', 'Geographic West Bounding Longitude'),
+    ('eastBL', 'Geographic East Bounding Longitude'),
+    ('northBL', 'Geographic North Bounding Latitude'),
+    ('southBL', 'Geographic South Bounding Latitude'),
+)
+_DATA_ID_TEXT = (
+    ('idAbs', 'Abstract'),
+    ('idPurp', 'Purpose'),
+    ('idCredit', 'Credit'),
+    ('.//useLimit', 'Use Limitation'),
+    ('.//othConsts', 'Other Constraints'),
+    ('.//dataScale/equScale/rfDenom', 'Scale Denominator'),
+    ('envirDesc', 'Environment Description'),
+)
+_DATA_ID_CODES = (
+    ('.//accessConsts/RestrictCd', 'Access Constraints', 'MD_RestrictionCode'),
+    ('.//dataChar/CharSetCd', 'Character Set', 'MD_CharacterSetCode'),
+    ('.//spatRpType/SpatRepTypCd', 'Spatial Representation Type',
+     'MD_SpatialRepresentationTypeCode'),
+    ('.//idStatus/ProgCd', 'Status', 'MD_ProgressCode'),
+    ('.//resMaint/maintFreq/MaintFreqCd', 'Maintenance Frequency',
+     'MD_MaintenanceFrequencyCode'),
+    ('.//tpCat/TopicCatCd', 'Topic Category', 'MD_TopicCategoryCode'),
+)
+_DATA_ID_ATTRS = (
+    ('.//dataLang/languageCode', 'Data Language'),
+    ('.//dataLang/countryCode', 'Data Country Code'),
+)
+_GRAPH_OVER_TEXT = (
+    ('bgFileName', 'Graphic File Name'),
+    ('bgFileDesc', 'Graphic File Description'),
+    ('bgFileType', 'Graphic File Type'),
+)
+_CONTACT_TEXT = (
+    ('rpIndName', 'Contact Individual Name'),
+    ('rpOrgName', 'Contact Organisation Name'),
+    ('rpPosName', 'Contact Position Name'),
+)
+_ADDRESS_TEXT = (
+    ('eMailAdd', 'Contact Email Address'),
+    ('delPoint', 'Contact Delivery Point'),
+    ('city', 'Contact City'),
+    ('adminArea', 'Contact Administrative Area'),
+    ('postCode', 'Contact Postal Code'),
+    ('country', 'Contact Country'),
+)
+_CNT_INFO_TEXT = (
+    ('.//cntPhone/voiceNum', 'Contact Phone Number'),
+    ('.//cntOnlineRes/linkage', 'Contact Online Resource'),
+    ('.//cntHours', 'Contact Hours'),
+    ('.//cntInstr', 'Contact Instructions'),
+)
+_ENTTYP_TEXT = (
+    ('enttypl', 'Entity Type Label'),
+    ('enttypt', 'Entity Type Type'),
+    ('enttypc', 'Entity Type Count'),
+)
+_REF_SYS_TEXT = (
+    ('idCodeSpace', 'Reference System Code Space'),
+    ('idVersion', 'Reference System Version'),
+)
+_ONLINE_SRC_TEXT = (
+    ('linkage', 'Distribution Online Resource Linkage'),
+    ('protocol', 'Distribution Protocol'),
+    ('orName', 'Distribution Online Resource Name'),
+    ('orDesc', 'Distribution Online Resource Description'),
+)
+_MD_LANG_ATTRS = (
+    ('languageCode', 'Metadata Language Code'),
+    ('countryCode', 'Metadata Country Code'),
+)
+# Single text elements looked up straight off the document index.
+_ROOT_TEXT = (
+    ('mdHrLvName', 'Metadata Hierarchy Level Name'),
+    ('mdStanName', 'Metadata Standard Name'),
+    ('mdStanVer', 'Metadata Standard Version'),
+    ('mdFileID', 'Metadata File ID'),
+    ('mdDateSt', 'Metadata Date Stamp'),
+)
+
+
 def extract_all_fields(root):
     """
     Extract all supported metadata fields from an ISO 19139 / ArcGIS metadata XML root.
 
     Walks Esri, dataIdInfo, mdContact, eainfo, spatRepInfo, refSysInfo, dqInfo,
-    distInfo, mdMaint, mdLang, mdHrLv, spdoinfo, and related elements. Only non-empty
-    values are stored. If the same field is set more than once (e.g. multiple keywords),
-    values are concatenated with " | ".
+    distInfo, mdMaint, mdLang, mdHrLv, spdoinfo, and related elements, driven by
+    the per-section field spec tables above. Only non-empty values are stored.
+    If the same field is set more than once (e.g. multiple keywords), values are
+    concatenated with " | ".
 
     Args:
         root: The root Element of the parsed XML (e.g. from ET.parse(path).getroot()).
               Can be Esri/ArcGIS-style or standard ISO 19139.
 
     Returns:
-        OrderedDict mapping display field names (e.g. "Resource Title") to string values.
+        Dict mapping display field names (e.g. "Resource Title") to string values,
+        in extraction order (dicts preserve insertion order).
         Order of insertion is preserved for consistent column ordering when combined
         with other files.
     """
-    fields = OrderedDict()
+    fields = {}
+    # Local aliases for the helpers called on nearly every line below; a
+    # LOAD_FAST beats the module-global lookup each call would otherwise pay.
+    _text = get_text
+    _resolve = resolve_codelist
+    # One walk over the tree; section roots below come from this index instead
+    # of a full root.find('.//...') scan each.
+    _first = _index_tree(root).get
 
     def add_field(field_name, value):
         """Add a non-empty field to the accumulator. If key exists, append with ' | '."""
         if value:
-            # If field already exists, append with separator
-            if field_name in fields:
-                if fields[field_name]:
-                    fields[field_name] = f"{fields[field_name]} | {value}"
-                else:
-                    fields[field_name] = value
+            # Accumulate repeats as a list; they are joined with ' | ' at the
+            # end, so K values cost O(K) instead of rebuilding the string each
+            # time.
+            parts = fields.get(field_name)
+            if parts is None:
+                fields[field_name] = [str(value)]
             else:
-                fields[field_name] = str(value)
-    
+                parts.append(str(value))
+
+    def add_texts(parent, specs):
+        """Add each (relative path, name) spec's element text under parent."""
+        for rel_path, name in specs:
+            add_field(name, _text(parent.find(rel_path)))
+
+    def add_codes(parent, specs):
+        """Add each (relative path, name, codelist) spec's resolved code label."""
+        for rel_path, name, codelist in specs:
+            el = parent.find(rel_path)
+            if el is not None:
+                add_field(name, _resolve(_codelist_attr(el), codelist))
+
+    def add_attrs(parent, specs):
+        """Add each (relative path, name) spec's plain 'value' attribute."""
+        for rel_path, name in specs:
+            el = parent.find(rel_path)
+            if el is not None:
+                value = el.get('value', '')
+                if value:
+                    # Short recurring tokens (language/country codes): intern
+                    # so every file shares one copy in the combined export.
+                    add_field(name, sys.intern(value))
+
     # Extract Esri metadata
-    esri = root.find('.//Esri')
+    esri = _first('Esri')
     if esri is not None:
-        add_field("ArcGIS Format", get_text(esri.find('ArcGISFormat')))
-        add_field("ArcGIS Profile", get_text(esri.find('ArcGISProfile')))
-        add_field("Creation Date", get_text(esri.find('CreaDate')))
-        add_field("Creation Time", get_text(esri.find('CreaTime')))
-        add_field("Modification Date", get_text(esri.find('ModDate')))
-        add_field("Modification Time", get_text(esri.find('ModTime')))
-        
+        add_texts(esri, _ESRI_TEXT)
+
         # Data Properties
         data_props = esri.find('.//DataProperties')
         if data_props is not None:
             item_props = data_props.find('.//itemProps')
             if item_props is not None:
-                add_field("Item Name", get_text(item_props.find('itemName')))
-                add_field("Content Type", resolve_codelist(
-                    get_text(item_props.find('imsContentType')) or "",
+                add_field("Item Name", _text(item_props.find('itemName')))
+                add_field("Content Type", _resolve(
+                    _text(item_props.find('imsContentType')) or "",
                     "ArcGIS_ContentTypeCode"))
-                
+
                 # Native extent
                 native_ext = item_props.find('.//nativeExtBox')
                 if native_ext is not None:
-                    add_field("West Bounding Longitude", get_text(native_ext.find('westBL')))
-                    add_field("East Bounding Longitude", get_text(native_ext.find('eastBL')))
-                    add_field("South Bounding Latitude", get_text(native_ext.find('southBL')))
-                    add_field("North Bounding Latitude", get_text(native_ext.find('northBL')))
-                
+                    add_texts(native_ext, _NATIVE_EXT_TEXT)
+
                 # Portal details
                 portal = item_props.find('.//portalDetails')
                 if portal is not None:
-                    add_field("Thumbnail URL", get_text(portal.find('thumbnailURL')))
-            
+                    add_field("Thumbnail URL", _text(portal.find('thumbnailURL')))
+
             # Coordinate reference
             coord_ref = data_props.find('.//coordRef')
             if coord_ref is not None:
-                add_field("Coordinate System Type", get_text(coord_ref.find('type')))
-                add_field("Geographic CS Name", get_text(coord_ref.find('geogcsn')))
-                add_field("Projected CS Name", get_text(coord_ref.find('projcsn')))
-                add_field("Coordinate System Units", get_text(coord_ref.find('csUnits')))
-        
+                add_texts(coord_ref, _COORD_REF_TEXT)
+
         # Scale range
         scale_range = esri.find('.//scaleRange')
         if scale_range is not None:
-            add_field("Minimum Scale", get_text(scale_range.find('minScale')))
-            add_field("Maximum Scale", get_text(scale_range.find('maxScale')))
-    
+            add_texts(scale_range, _SCALE_RANGE_TEXT)
+
     # Extract Data Identification Info
-    data_id = root.find('.//dataIdInfo')
+    data_id = _first('dataIdInfo')
     if data_id is not None:
-        # Abstract
-        abstract = data_id.find('idAbs')
-        if abstract is not None:
-            add_field("Abstract", get_text(abstract))
-        
+        add_texts(data_id, _DATA_ID_TEXT)
+        add_codes(data_id, _DATA_ID_CODES)
+        add_attrs(data_id, _DATA_ID_ATTRS)
+
         # Citation
         citation = data_id.find('idCitation')
         if citation is not None:
-            add_field("Resource Title", get_text(citation.find('resTitle')))
-            add_field("Resource Alternative Title", get_text(citation.find('resAltTitle')))
-            add_field("Collection Title", get_text(citation.find('collTitle')))
-            
-            date_elem = citation.find('.//date/pubDate')
-            if date_elem is not None:
-                add_field("Publication Date", get_text(date_elem))
-            
-            pres_form = citation.find('.//presForm/PresFormCd')
-            if pres_form is not None:
-                add_field("Presentation Form", resolve_codelist(
-                    get_attribute_value(pres_form, 'value') or get_attribute_value(pres_form, 'codeListValue'),
-                    "CI_PresentationFormCode"))
-        
+            add_texts(citation, _CITATION_TEXT)
+            add_codes(citation, (
+                ('.//presForm/PresFormCd', 'Presentation Form',
+                 'CI_PresentationFormCode'),))
+
         # Extent
         data_ext = data_id.find('dataExt')
         if data_ext is not None:
-            add_field("Extent Description", get_text(data_ext.find('exDesc')))
-            
+            add_field("Extent Description", _text(data_ext.find('exDesc')))
+
             geo_bbox = data_ext.find('.//GeoBndBox')
             if geo_bbox is not None:
-                add_field("Geographic West Bounding Longitude", get_text(geo_bbox.find('westBL')))
-                add_field("Geographic East Bounding Longitude", get_text(geo_bbox.find('eastBL')))
-                add_field("Geographic North Bounding Latitude", get_text(geo_bbox.find('northBL')))
-                add_field("Geographic South Bounding Latitude", get_text(geo_bbox.find('southBL')))
-        
+                add_texts(geo_bbox, _GEO_BBOX_TEXT)
+
         # Keywords
         keywords = data_id.findall('.//searchKeys/keyword')
-        keyword_list = [get_text(kw) for kw in keywords if get_text(kw)]
+        keyword_list = [_text(kw) for kw in keywords if _text(kw)]
         if keyword_list:
             add_field("Keywords", ', '.join(keyword_list))
-        
-        # Purpose
-        add_field("Purpose", get_text(data_id.find('idPurp')))
-        
-        # Credit
-        add_field("Credit", get_text(data_id.find('idCredit')))
-        
-        # Constraints
-        use_limit = data_id.find('.//useLimit')
-        if use_limit is not None:
-            add_field("Use Limitation", get_text(use_limit))
-        
-        access_const = data_id.find('.//accessConsts/RestrictCd')
-        if access_const is not None:
-            add_field("Access Constraints", resolve_codelist(
-                get_attribute_value(access_const, 'value') or get_attribute_value(access_const, 'codeListValue'),
-                "MD_RestrictionCode"))
-        
-        other_const = data_id.find('.//othConsts')
-        if other_const is not None:
-            add_field("Other Constraints", get_text(other_const))
-        
-        # Language
-        lang_code = data_id.find('.//dataLang/languageCode')
-        if lang_code is not None:
-            add_field("Data Language", get_attribute_value(lang_code, 'value'))
-        
-        country_code = data_id.find('.//dataLang/countryCode')
-        if country_code is not None:
-            add_field("Data Country Code", get_attribute_value(country_code, 'value'))
-        
-        # Character Set
-        char_set = data_id.find('.//dataChar/CharSetCd')
-        if char_set is not None:
-            add_field("Character Set", resolve_codelist(
-                get_attribute_value(char_set, 'value') or get_attribute_value(char_set, 'codeListValue'),
-                "MD_CharacterSetCode"))
-        
-        # Spatial Representation Type
-        spat_rep = data_id.find('.//spatRpType/SpatRepTypCd')
-        if spat_rep is not None:
-            add_field("Spatial Representation Type", resolve_codelist(
-                get_attribute_value(spat_rep, 'value') or get_attribute_value(spat_rep, 'codeListValue'),
-                "MD_SpatialRepresentationTypeCode"))
-        
-        # Scale
-        scale = data_id.find('.//dataScale/equScale/rfDenom')
-        if scale is not None:
-            add_field("Scale Denominator", get_text(scale))
-        
-        # Environment
-        envir = data_id.find('envirDesc')
-        if envir is not None:
-            add_field("Environment Description", get_text(envir))
-        
-        # Status
-        status = data_id.find('.//idStatus/ProgCd')
-        if status is not None:
-            add_field("Status", resolve_codelist(
-                get_attribute_value(status, 'value') or get_attribute_value(status, 'codeListValue'),
-                "MD_ProgressCode"))
-        
+
         # Graphic Overview
         graph_over = data_id.find('graphOver')
         if graph_over is not None:
-            add_field("Graphic File Name", get_text(graph_over.find('bgFileName')))
-            add_field("Graphic File Description", get_text(graph_over.find('bgFileDesc')))
-            add_field("Graphic File Type", get_text(graph_over.find('bgFileType')))
-        
-        # Maintenance
-        maint = data_id.find('.//resMaint/maintFreq/MaintFreqCd')
-        if maint is not None:
-            add_field("Maintenance Frequency", resolve_codelist(
-                get_attribute_value(maint, 'value') or get_attribute_value(maint, 'codeListValue'),
-                "MD_MaintenanceFrequencyCode"))
-        
-        # Topic Category
-        topic_cat = data_id.find('.//tpCat/TopicCatCd')
-        if topic_cat is not None:
-            add_field("Topic Category", resolve_codelist(
-                get_attribute_value(topic_cat, 'value') or get_attribute_value(topic_cat, 'codeListValue'),
-                "MD_TopicCategoryCode"))
-        
+            add_texts(graph_over, _GRAPH_OVER_TEXT)
+
         # Other Keywords
         other_keys = data_id.findall('.//otherKeys')
         for other_key in other_keys:
-            thesa_name = get_text(other_key.find('.//thesaName/resTitle'))
-            keywords = [get_text(kw) for kw in other_key.findall('keyword') if get_text(kw)]
+            thesa_name = _text(other_key.find('.//thesaName/resTitle'))
+            keywords = [_text(kw) for kw in other_key.findall('keyword') if _text(kw)]
             if keywords:
                 key_name = f"Other Keywords ({thesa_name})" if thesa_name else "Other Keywords"
                 add_field(key_name, ', '.join(keywords))
-    
+
     # Extract Contact Information
-    contact = root.find('.//mdContact')
+    contact = _first('mdContact')
     if contact is not None:
-        add_field("Contact Individual Name", get_text(contact.find('rpIndName')))
-        add_field("Contact Organisation Name", get_text(contact.find('rpOrgName')))
-        add_field("Contact Position Name", get_text(contact.find('rpPosName')))
-        
+        add_texts(contact, _CONTACT_TEXT)
+
         cnt_info = contact.find('.//rpCntInfo')
         if cnt_info is not None:
             # Address
             address = cnt_info.find('.//cntAddress')
             if address is not None:
-                add_field("Contact Email Address", get_text(address.find('eMailAdd')))
-                add_field("Contact Delivery Point", get_text(address.find('delPoint')))
-                add_field("Contact City", get_text(address.find('city')))
-                add_field("Contact Administrative Area", get_text(address.find('adminArea')))
-                add_field("Contact Postal Code", get_text(address.find('postCode')))
-                add_field("Contact Country", get_text(address.find('country')))
-            
-            # Phone
-            phone = cnt_info.find('.//cntPhone/voiceNum')
-            if phone is not None:
-                add_field("Contact Phone Number", get_text(phone))
-            
-            # Online Resource
-            online = cnt_info.find('.//cntOnlineRes/linkage')
-            if online is not None:
-                add_field("Contact Online Resource", get_text(online))
-            
-            # Hours
-            hours = cnt_info.find('.//cntHours')
-            if hours is not None:
-                add_field("Contact Hours", get_text(hours))
-            
-            # Instructions
-            instr = cnt_info.find('.//cntInstr')
-            if instr is not None:
-                add_field("Contact Instructions", get_text(instr))
-        
-        role = contact.find('.//role/RoleCd')
-        if role is not None:
-            add_field("Contact Role", resolve_codelist(
-                get_attribute_value(role, 'value') or get_attribute_value(role, 'codeListValue'),
-                "CI_RoleCode"))
-    
+                add_texts(address, _ADDRESS_TEXT)
+            add_texts(cnt_info, _CNT_INFO_TEXT)
+
+        add_codes(contact, (('.//role/RoleCd', 'Contact Role', 'CI_RoleCode'),))
+
     # Extract Attribute Definitions (eainfo)
-    eainfo = root.find('.//eainfo/detailed')
+    eainfo = _first('eainfo')
+    eainfo = eainfo.find('detailed') if eainfo is not None else None
     if eainfo is not None:
         enttyp = eainfo.find('enttyp')
         if enttyp is not None:
-            add_field("Entity Type Label", get_text(enttyp.find('enttypl')))
-            add_field("Entity Type Type", get_text(enttyp.find('enttypt')))
-            add_field("Entity Type Count", get_text(enttyp.find('enttypc')))
-        
+            add_texts(enttyp, _ENTTYP_TEXT)
+
         # Process all attributes - store as a summary
         attributes = eainfo.findall('.//attr')
         attr_summaries = []
         for attr in attributes:
-            attr_label = get_text(attr.find('attrlabl'))
+            attr_label = _text(attr.find('attrlabl'))
             if attr_label:
                 attr_summaries.append(attr_label)
         if attr_summaries:
             add_field("Attribute Names", ', '.join(attr_summaries))
-    
+
     # Extract Spatial Representation Info
-    spat_rep_info = root.find('.//spatRepInfo')
+    spat_rep_info = _first('spatRepInfo')
     if spat_rep_info is not None:
-        top_level = spat_rep_info.find('.//topLvl/TopoLevCd')
-        if top_level is not None:
-            add_field("Topology Level", resolve_codelist(
-                get_attribute_value(top_level, 'value') or get_attribute_value(top_level, 'codeListValue'),
-                "MD_TopologyLevelCode"))
-        
+        add_codes(spat_rep_info, (
+            ('.//topLvl/TopoLevCd', 'Topology Level', 'MD_TopologyLevelCode'),))
+
         geo_objs = spat_rep_info.find('.//geometObjs')
         if geo_objs is not None:
-            geo_type = geo_objs.find('.//geoObjTyp/GeoObjTypCd')
-            if geo_type is not None:
-                add_field("Geometry Object Type", resolve_codelist(
-                    get_attribute_value(geo_type, 'value') or get_attribute_value(geo_type, 'codeListValue'),
-                    "MD_GeometricObjectTypeCode"))
-            
-            geo_count = geo_objs.find('.//geoObjCnt')
-            if geo_count is not None:
-                add_field("Geometry Object Count", get_text(geo_count))
-    
+            add_codes(geo_objs, (
+                ('.//geoObjTyp/GeoObjTypCd', 'Geometry Object Type',
+                 'MD_GeometricObjectTypeCode'),))
+            add_field("Geometry Object Count", _text(geo_objs.find('.//geoObjCnt')))
+
     # Extract Reference System Info
-    ref_sys = root.find('.//refSysInfo/RefSystem/refSysID')
+    ref_sys = _first('refSysInfo')
+    ref_sys = ref_sys.find('RefSystem/refSysID') if ref_sys is not None else None
     if ref_sys is not None:
         ident_code = ref_sys.find('identCode')
         if ident_code is not None:
-            add_field("Reference System Code", get_attribute_value(ident_code, 'code'))
-        
-        code_space = ref_sys.find('idCodeSpace')
-        if code_space is not None:
-            add_field("Reference System Code Space", get_text(code_space))
-        
-        version = ref_sys.find('idVersion')
-        if version is not None:
-            add_field("Reference System Version", get_text(version))
-    
+            code = ident_code.get('code', '')
+            if code:
+                # EPSG-style codes repeat across a folder; share one copy.
+                add_field("Reference System Code", sys.intern(code))
+        add_texts(ref_sys, _REF_SYS_TEXT)
+
     # Extract Data Quality Info
-    dq_info = root.find('.//dqInfo')
+    dq_info = _first('dqInfo')
     if dq_info is not None:
-        scope = dq_info.find('.//scpLvl/ScopeCd')
-        if scope is not None:
-            add_field("Data Quality Scope Level", resolve_codelist(
-                get_attribute_value(scope, 'value') or get_attribute_value(scope, 'codeListValue'),
-                "MD_ScopeCode"))
-        
-        lineage = dq_info.find('.//dataLineage/statement')
-        if lineage is not None:
-            add_field("Lineage Statement", get_text(lineage))
-        
+        add_codes(dq_info, (
+            ('.//scpLvl/ScopeCd', 'Data Quality Scope Level', 'MD_ScopeCode'),))
+        add_field("Lineage Statement", _text(dq_info.find('.//dataLineage/statement')))
+
         report = dq_info.find('.//report')
         if report is not None:
             report_type = report.get('type', '')
             add_field("Quality Report Type", report_type)
-            
-            con_spec = report.find('.//conSpec/resTitle')
-            if con_spec is not None:
-                add_field("Conformance Specification Title", get_text(con_spec))
-            
-            con_pass = report.find('.//conPass')
-            if con_pass is not None:
-                add_field("Conformance Pass", get_text(con_pass))
-    
+            add_field("Conformance Specification Title",
+                      _text(report.find('.//conSpec/resTitle')))
+            add_field("Conformance Pass", _text(report.find('.//conPass')))
+
     # Extract Distribution Info
-    dist_info = root.find('.//distInfo')
+    dist_info = _first('distInfo')
     if dist_info is not None:
         online_src = dist_info.find('.//onLineSrc')
         if online_src is not None:
-            linkage = online_src.find('linkage')
-            if linkage is not None:
-                add_field("Distribution Online Resource Linkage", get_text(linkage))
-            
-            protocol = online_src.find('protocol')
-            if protocol is not None:
-                add_field("Distribution Protocol", get_text(protocol))
-            
-            or_name = online_src.find('orName')
-            if or_name is not None:
-                add_field("Distribution Online Resource Name", get_text(or_name))
-            
-            or_desc = online_src.find('orDesc')
-            if or_desc is not None:
-                add_field("Distribution Online Resource Description", get_text(or_desc))
-    
+            add_texts(online_src, _ONLINE_SRC_TEXT)
+
     # Extract Maintenance Info
-    md_maint = root.find('.//mdMaint')
+    md_maint = _first('mdMaint')
     if md_maint is not None:
-        maint_freq = md_maint.find('.//maintFreq/MaintFreqCd')
-        if maint_freq is not None:
-            add_field("Metadata Maintenance Frequency", resolve_codelist(
-                get_attribute_value(maint_freq, 'value') or get_attribute_value(maint_freq, 'codeListValue'),
-                "MD_MaintenanceFrequencyCode"))
-    
+        add_codes(md_maint, (
+            ('.//maintFreq/MaintFreqCd', 'Metadata Maintenance Frequency',
+             'MD_MaintenanceFrequencyCode'),))
+
     # Extract Metadata Language
-    md_lang = root.find('.//mdLang')
+    md_lang = _first('mdLang')
     if md_lang is not None:
-        lang_code = md_lang.find('languageCode')
-        if lang_code is not None:
-            add_field("Metadata Language Code", get_attribute_value(lang_code, 'value'))
-        
-        country_code = md_lang.find('countryCode')
-        if country_code is not None:
-            add_field("Metadata Country Code", get_attribute_value(country_code, 'value'))
-    
+        add_attrs(md_lang, _MD_LANG_ATTRS)
+
     # Extract Metadata Hierarchy Level
-    md_hr_lv = root.find('.//mdHrLv')
+    md_hr_lv = _first('mdHrLv')
     if md_hr_lv is not None:
-        scope_cd = md_hr_lv.find('ScopeCd')
-        if scope_cd is not None:
-            add_field("Metadata Scope Code", resolve_codelist(
-                get_attribute_value(scope_cd, 'value') or get_attribute_value(scope_cd, 'codeListValue'),
-                "MD_ScopeCode"))
-    
-    hr_lv_name = root.find('.//mdHrLvName')
-    if hr_lv_name is not None:
-        add_field("Metadata Hierarchy Level Name", get_text(hr_lv_name))
-    
+        add_codes(md_hr_lv, (('ScopeCd', 'Metadata Scope Code', 'MD_ScopeCode'),))
+
     # Extract Spatial Domain Info
-    spdo_info = root.find('.//spdoinfo')
+    spdo_info = _first('spdoinfo')
     if spdo_info is not None:
         esri_term = spdo_info.find('.//esriterm')
         if esri_term is not None:
-            name = esri_term.get('Name', '')
-            add_field("Feature Name", name)
-            
-            feat_type = esri_term.find('efeatyp')
-            if feat_type is not None:
-                add_field("Feature Type", get_text(feat_type))
-            
+            add_field("Feature Name", esri_term.get('Name', ''))
+            add_field("Feature Type", _text(esri_term.find('efeatyp')))
+
             feat_geom = esri_term.find('efeageom')
             if feat_geom is not None:
-                add_field("Feature Geometry Code", resolve_codelist(
-                    get_attribute_value(feat_geom, 'code') or "",
-                    "MD_GeometricObjectTypeCode"))
-    
-    # Extract Metadata Standard
-    md_std_name = root.find('.//mdStanName')
-    if md_std_name is not None:
-        add_field("Metadata Standard Name", get_text(md_std_name))
-    
-    md_std_ver = root.find('.//mdStanVer')
-    if md_std_ver is not None:
-        add_field("Metadata Standard Version", get_text(md_std_ver))
-    
-    # Extract File ID
-    md_file_id = root.find('.//mdFileID')
-    if md_file_id is not None:
-        add_field("Metadata File ID", get_text(md_file_id))
-    
-    md_char = root.find('.//mdChar')
+                add_field("Feature Geometry Code", _resolve(
+                    feat_geom.get('code', ''), "MD_GeometricObjectTypeCode"))
+
+    # Metadata standard, file ID, hierarchy level name, date stamp
+    for key, name in _ROOT_TEXT:
+        add_field(name, _text(_first(key)))
+
+    md_char = _first('mdChar')
     if md_char is not None:
-        char_set = md_char.find('CharSetCd')
-        if char_set is not None:
-            add_field("Metadata Character Set", resolve_codelist(
-                get_attribute_value(char_set, 'value') or get_attribute_value(char_set, 'codeListValue'),
-                "MD_CharacterSetCode"))
-    
-    md_date = root.find('.//mdDateSt')
-    if md_date is not None:
-        add_field("Metadata Date Stamp", get_text(md_date))
-    
+        add_codes(md_char, (
+            ('CharSetCd', 'Metadata Character Set', 'MD_CharacterSetCode'),))
+
+    return {name: ' | '.join(parts) for name, parts in fields.items()}
+
+
+def _parse_pruned(xml_path):
+    """
+    Parse a file incrementally, discarding the base64 payload of each ArcGIS
+    <Binary> enclosure (embedded thumbnails) as it closes. The extractor only
+    reads the thumbnail URL, and these blobs are often most of the file, so
+    clearing them keeps peak memory close to the metadata proper.
+    """
+    if _PARSER is not None:
+        events = ET.iterparse(
+            str(xml_path), events=("end",),
+            huge_tree=True, collect_ids=False, resolve_entities=False,
+            no_network=True, remove_comments=True, remove_pis=True,
+        )
+    else:
+        events = ET.iterparse(str(xml_path), events=("end",))
+    elem = None
+    for _, elem in events:
+        if elem.tag == "Binary":
+            elem.clear()
+    return elem  # the final end event is the document root
+
+
+def _extract_one_cached(xml_path, cache_dir):
+    """
+    Extract one file, reusing a cached record from a previous run when the
+    file looks unchanged. With cache_dir None the cache is bypassed entirely.
+
+    Metadata folders change slowly between runs, so re-runs mostly re-parse
+    identical files. The cache keys on name, size and mtime — checked from one
+    stat, without reading the file — and stores the extracted field dict as
+    JSON; touched or edited files get a new key and are re-extracted, and
+    stale entries are simply never read again.
+    """
+    if cache_dir is None:
+        root = _parse_pruned(xml_path)
+        return extract_all_fields(root) if root is not None else None
+    st = xml_path.stat()
+    key = "%s\0%d\0%d" % (xml_path.name, st.st_size, st.st_mtime_ns)
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    cache_file = cache_dir / (digest + ".json")
+    if cache_file.exists():
+        try:
+            return json.loads(cache_file.read_text())["fields"]
+        except (ValueError, KeyError, OSError):
+            pass  # unreadable entry: fall through and recompute
+    root = _parse_pruned(xml_path)
+    if root is None:
+        return None
+    fields = extract_all_fields(root)
+    try:
+        cache_file.write_text(json.dumps({"fields": fields}))
+    except OSError:
+        pass  # cache is best-effort; the run still succeeds without it
     return fields
 
 
-def process_all_xml_files(xml_folder):
+# Per-worker state, set once per pool process via the initializer so the
+# cache directory does not have to travel with every task.
+_WORKER_CACHE_DIR = None
+
+
+def _init_extract_worker(cache_dir):
+    """Pool initializer: record the cache directory for this worker."""
+    global _WORKER_CACHE_DIR
+    _WORKER_CACHE_DIR = cache_dir
+
+
+def _extract_worker(xml_path):
+    """
+    Parse and extract a single file; used directly and as the process-pool
+    worker. Returns (filename, fields, error_message) where exactly one of
+    fields/error_message is None — plain picklable values only.
+    """
+    filename = xml_path.name
+    try:
+        fields = _extract_one_cached(xml_path, _WORKER_CACHE_DIR)
+        if fields is None:
+            return filename, None, f"Error parsing {filename}: empty document"
+        return filename, fields, None
+    except _PARSE_ERROR as e:
+        return filename, None, f"Error parsing {filename}: {e}"
+    except Exception as e:
+        return filename, None, f"Error processing {filename}: {e}"
+
+
+def process_all_xml_files(xml_folder, quiet=False, cache_dir=None):
     """
     Discover and process every .xml file in the given folder.
 
@@ -1349,43 +1441,68 @@ def process_all_xml_files(xml_folder):
     file are logged but do not stop the run. The union of all attribute names
     across successful files is returned as the canonical column set.
 
+    Files are independent, so larger folders are extracted in parallel across a
+    process pool (workers return plain dicts; the workbook is only assembled in
+    the main process); small folders stay serial to avoid the pool start-up cost.
+
     Args:
         xml_folder: Path to the directory containing .xml metadata files (str or Path).
+        quiet: Suppress the per-file "Processed:" lines (errors still print);
+               flushing one line per file is measurable on very large folders.
+        cache_dir: Directory for cached extraction results (created if needed);
+                   None disables caching.
 
     Returns:
         Tuple (all_data, sorted_field_names), or (None, None) if the folder does not
         exist or contains no .xml files.
-        - all_data: Dict mapping filename (str) to OrderedDict of field name -> value.
+        - all_data: Dict mapping filename (str) to dict of field name -> value.
         - sorted_field_names: Sorted list of all unique attribute names found.
     """
     xml_folder = Path(xml_folder)
-    xml_files = sorted(xml_folder.glob("*.xml"))
+    # One scandir pass: DirEntry carries the stat from the directory read, so
+    # the sizes used for scheduling below cost no extra syscalls.
+    with os.scandir(xml_folder) as entries:
+        sizes = {
+            Path(entry.path): entry.stat().st_size
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(".xml")
+        }
+    xml_files = sorted(sizes)
     
     if not xml_files:
         print(f"No XML files found in {xml_folder}")
         return None, None
     
     print(f"Found {len(xml_files)} XML files to process")
-    
+
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
     all_data = {}  # filename -> fields dictionary
     all_field_names = set()  # Collect all unique field names
     
-    for xml_file in xml_files:
-        filename = xml_file.name
-        print(f"Processing: {filename}")
-        
-        try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            fields = extract_all_fields(root)
-            
-            all_data[filename] = fields
-            all_field_names.update(fields.keys())
-            
-        except ET.ParseError as e:
-            print(f"  Error parsing {filename}: {e}")
-        except Exception as e:
-            print(f"  Error processing {filename}: {e}")
+    if len(xml_files) >= 4:
+        # Largest files first so a big file picked up last cannot leave the
+        # other workers idle at the end of the run.
+        by_size = sorted(xml_files, key=sizes.__getitem__, reverse=True)
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_extract_worker, initargs=(cache_dir,),
+        ) as pool:
+            outcomes = list(pool.map(_extract_worker, by_size, chunksize=8))
+    else:
+        _init_extract_worker(cache_dir)
+        outcomes = [_extract_worker(xml_file) for xml_file in xml_files]
+
+    for filename, fields, error in outcomes:
+        if error:
+            print(f"  {error}")
+            continue
+        if not quiet:
+            print(f"Processed: {filename}")
+        all_data[filename] = fields
+        all_field_names.update(fields.keys())
     
     # Sort field names for consistent column order
     sorted_field_names = sorted(all_field_names)
@@ -1393,7 +1510,11 @@ def process_all_xml_files(xml_folder):
     return all_data, sorted_field_names
 
 
-def compute_compliance(all_data, field_names):
+ComplianceRecord = namedtuple(
+    "ComplianceRecord", ["filename", "compliant", "missing_mandatory", "missing_count"])
+
+
+def compute_compliance(sorted_items, field_names):
     """
     Assess ISO 19139 compliance for each file based on presence of mandatory fields.
 
@@ -1402,29 +1523,28 @@ def compute_compliance(all_data, field_names):
     value. Conditional and optional fields do not affect the compliant flag.
 
     Args:
-        all_data: Dict mapping filename to dict of field name -> value (as from
-                  process_all_xml_files).
+        sorted_items: Filename-sorted list of (filename, fields dict) pairs;
+                      create_excel_matrix sorts all_data once and shares it.
         field_names: List of all attribute names (column set).
 
     Returns:
-        List of dicts, one per file (sorted by filename), each with keys:
-        - "Filename": str
-        - "Compliant": "Yes" or "No"
-        - "Missing mandatory": comma-separated list of missing mandatory field names
-        - "Missing count": int
+        List of ComplianceRecord tuples, one per file (sorted by filename),
+        with fields filename, compliant ("Yes"/"No"), missing_mandatory
+        (comma-separated list) and missing_count.
     """
-    mandatory_fields = [fn for fn in field_names if get_field_obligation(fn) == "mandatory"]
+    mandatory_fields = [fn for fn in field_names if fn in _MANDATORY_FIELDS]
     results = []
-    for filename in sorted(all_data.keys()):
-        fields = all_data[filename]
-        missing = [fn for fn in mandatory_fields if not (fields.get(fn) or "").strip()]
-        compliant = len(missing) == 0
-        results.append({
-            "Filename": filename,
-            "Compliant": "Yes" if compliant else "No",
-            "Missing mandatory": ", ".join(missing) if missing else "",
-            "Missing count": len(missing),
-        })
+    for filename, fields in sorted_items:
+        get = fields.get
+        # Values are whitespace-normalised at extraction time and add_field
+        # never stores a blank, so presence is a single truthy get.
+        missing = [fn for fn in mandatory_fields if not get(fn)]
+        results.append(ComplianceRecord(
+            filename,
+            "No" if missing else "Yes",
+            ", ".join(missing) if missing else "",
+            len(missing),
+        ))
     return results
 
 
@@ -1450,129 +1570,131 @@ def create_excel_matrix(all_data, field_names, output_file):
     Returns:
         None. Writes the file and prints a short summary to stdout.
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Metadata Export"
-
-    # Row 1: Header row – Filename + all field names
-    headers = ['Filename'] + field_names
-    for col_num, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-    # Row 2: Optionality row – blank for Filename, then mandatory/optional/conditional per column
-    ws.cell(row=2, column=1).value = ""  # Filename column
-    obligation_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
+    # Imported here (not at module top) so plain module import — including
+    # every pool worker spawned for extraction — skips the openpyxl cost;
+    # only the parent process pays it, immediately before writing.
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
+
+    # Workbook styles, built once per run and shared; openpyxl style objects are immutable
+    # once assigned, so every cell can safely reference the same instance.
+    header_fill = PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFFFF")
+    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    obligation_fill = PatternFill(start_color="FFE0E0E0", end_color="FFE0E0E0", fill_type="solid")
     obligation_font = Font(italic=True)
-    for col_num, field_name in enumerate(field_names, 2):
-        cell = ws.cell(row=2, column=col_num)
-        cell.value = get_field_obligation(field_name)
-        cell.fill = obligation_fill
-        cell.font = obligation_font
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-    # Data rows (starting at row 3)
-    for row_idx, filename in enumerate(sorted(all_data.keys()), start=3):
-        fields = all_data[filename]
-        ws.cell(row=row_idx, column=1).value = filename
-        for col_num, field_name in enumerate(field_names, 2):
+    obligation_align = Alignment(horizontal="center", vertical="center")
+    body_align = Alignment(wrap_text=True, vertical="top")
+    note_align = Alignment(wrap_text=True)
+    empty_fill = PatternFill(start_color="FFE8E8E8", end_color="FFE8E8E8", fill_type="solid")
+    title_font = Font(bold=True, size=12)
+
+    # Write-only mode streams each appended row straight out instead of keeping
+    # a cell grid in memory; styling goes through WriteOnlyCell and column
+    # widths/freeze panes must be set before the first append.
+    wb = Workbook(write_only=True)
+
+    def styled(ws, value, fill=None, font=None, alignment=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if fill is not None:
+            cell.fill = fill
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        return cell
+
+    # One sort of (filename, fields) pairs feeds the compliance pass, the
+    # width scan and the data-row loop; no repeated sorted() per pass.
+    sorted_items = sorted(all_data.items())
+
+    # Compliance Summary sheet (first)
+    compliance = compute_compliance(sorted_items, field_names)
+    ws_summary = wb.create_sheet("Compliance Summary")
+    summary_headers = ["Filename", "ISO 19139 compliant", "Missing mandatory fields", "Missing count"]
+    for letter in ("A", "B", "C", "D"):
+        ws_summary.column_dimensions[letter].width = 24
+    ws_summary.append([styled(ws_summary, h, header_fill, header_font, header_align) for h in summary_headers])
+    compliant_count = 0
+    for rec in compliance:
+        compliant_count += rec.compliant == "Yes"
+        ws_summary.append([
+            rec.filename,
+            rec.compliant,
+            styled(ws_summary, rec.missing_mandatory, alignment=body_align),
+            rec.missing_count,
+        ])
+
+    # Metadata Export sheet: Row 1 = headers, Row 2 = optionality, Row 3+ = data
+    ws = wb.create_sheet("Metadata Export")
+    headers = ['Filename'] + field_names
+    obligations = [get_field_obligation(fn) for fn in field_names]
+
+    # Column widths are derived from the data up front (write-only sheets
+    # cannot be re-scanned after the rows are appended).
+    widths = [max(len("Filename"), max((len(f) for f, _ in sorted_items), default=0))]
+    for field_name, obligation in zip(field_names, obligations):
+        width = max(len(field_name), len(obligation))
+        for _, fields in sorted_items:
             val = fields.get(field_name, '')
-            ws.cell(row=row_idx, column=col_num).value = val
-
-    # Auto-adjust column widths
-    for col_num, header in enumerate(headers, 1):
-        max_length = len(str(header))
-        column_letter = get_column_letter(col_num)
-        for r in range(1, ws.max_row + 1):
-            cell = ws.cell(row=r, column=col_num)
-            if cell.value and len(str(cell.value)) > max_length:
-                max_length = min(len(str(cell.value)), 100)
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 100)
-
+            if val:
+                width = max(width, min(len(str(val)), 100))
+                if width >= 100:
+                    # Column is at the cap; no point measuring further rows.
+                    break
+        widths.append(width)
+    for col_num, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = min(width + 2, 100)
     # Freeze header and optionality row plus filename column
     ws.freeze_panes = 'B3'
 
-    # Text wrapping for data cells; shade empty cells light gray
-    empty_fill = PatternFill(start_color="E8E8E8", end_color="E8E8E8", fill_type="solid")
-    for row in ws.iter_rows(min_row=3, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-        for cell in row:
-            cell.alignment = Alignment(wrap_text=True, vertical='top')
-            if not (cell.value is not None and str(cell.value).strip()):
+    ws.append([styled(ws, h, header_fill, header_font, header_align) for h in headers])
+    ws.append(
+        [""]  # Filename column
+        + [styled(ws, ob, obligation_fill, obligation_font, obligation_align) for ob in obligations]
+    )
+    # Data rows: text wrapping everywhere; shade empty cells light gray
+    for filename, fields in sorted_items:
+        row = [styled(ws, filename, alignment=body_align)]
+        for field_name in field_names:
+            val = fields.get(field_name, '')
+            cell = styled(ws, val, alignment=body_align)
+            if not val:
+                # Extracted values are never blank strings, so falsy == absent.
                 cell.fill = empty_fill
-
-    # Compliance Summary sheet
-    compliance = compute_compliance(all_data, field_names)
-    ws_summary = wb.create_sheet("Compliance Summary", 0)
-    summary_headers = ["Filename", "ISO 19139 compliant", "Missing mandatory fields", "Missing count"]
-    for col_num, h in enumerate(summary_headers, 1):
-        c = ws_summary.cell(row=1, column=col_num)
-        c.value = h
-        c.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        c.font = Font(bold=True, color="FFFFFF")
-        c.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    for row_idx, rec in enumerate(compliance, start=2):
-        ws_summary.cell(row=row_idx, column=1).value = rec["Filename"]
-        ws_summary.cell(row=row_idx, column=2).value = rec["Compliant"]
-        ws_summary.cell(row=row_idx, column=3).value = rec["Missing mandatory"]
-        ws_summary.cell(row=row_idx, column=4).value = rec["Missing count"]
-    for col_num in range(1, 5):
-        ws_summary.column_dimensions[get_column_letter(col_num)].width = 24
-    for row in ws_summary.iter_rows(min_row=2, max_row=ws_summary.max_row, min_col=3, max_col=3):
-        for cell in row:
-            cell.alignment = Alignment(wrap_text=True, vertical='top')
+            row.append(cell)
+        ws.append(row)
 
     # Code resolution worksheet: fields that use codelists and how codes map to text
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF")
-    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    ws_codes = wb.create_sheet("Code resolution", 2)
-    row_num = 1
-    ws_codes.cell(row=row_num, column=1, value="Fields using code resolution - where code numbers are replaced in the report with full text for ease of reading")
-    ws_codes.cell(row=row_num, column=1).font = Font(bold=True, size=12)
-    row_num += 1
-    ws_codes.cell(row=row_num, column=1, value="Export field name")
-    ws_codes.cell(row=row_num, column=2, value="Codelist")
-    for c in range(1, 3):
-        ws_codes.cell(row=row_num, column=c).fill = header_fill
-        ws_codes.cell(row=row_num, column=c).font = header_font
-        ws_codes.cell(row=row_num, column=c).alignment = header_align
-    row_num += 1
-    for field_name, codelist_name in FIELD_TO_CODELIST:
-        ws_codes.cell(row=row_num, column=1, value=field_name)
-        ws_codes.cell(row=row_num, column=2, value=codelist_name)
-        row_num += 1
-    row_num += 1
-    ws_codes.cell(row=row_num, column=1, value="How codes are resolved to text")
-    ws_codes.cell(row=row_num, column=1).font = Font(bold=True, size=12)
-    row_num += 1
-    ws_codes.cell(row=row_num, column=1, value="Numeric codes (e.g. 005 in XML) and code names (e.g. license) are mapped to the labels below. ArcGIS often uses 3-digit numeric values.")
-    ws_codes.cell(row=row_num, column=1).alignment = Alignment(wrap_text=True)
-    row_num += 2
-    ws_codes.cell(row=row_num, column=1, value="Codelist")
-    ws_codes.cell(row=row_num, column=2, value="Code (numeric or name)")
-    ws_codes.cell(row=row_num, column=3, value="Resolved label")
-    for c in range(1, 4):
-        ws_codes.cell(row=row_num, column=c).fill = header_fill
-        ws_codes.cell(row=row_num, column=c).font = header_font
-        ws_codes.cell(row=row_num, column=c).alignment = header_align
-    row_num += 1
-    for codelist_name, code, label in get_codelist_resolution_table():
-        ws_codes.cell(row=row_num, column=1, value=codelist_name)
-        ws_codes.cell(row=row_num, column=2, value=code)
-        ws_codes.cell(row=row_num, column=3, value=label)
-        row_num += 1
+    ws_codes = wb.create_sheet("Code resolution")
     ws_codes.column_dimensions["A"].width = 32
     ws_codes.column_dimensions["B"].width = 28
     ws_codes.column_dimensions["C"].width = 36
+    ws_codes.append([styled(ws_codes, "Fields using code resolution - where code numbers are replaced in the report with full text for ease of reading", font=title_font)])
+    ws_codes.append([
+        styled(ws_codes, "Export field name", header_fill, header_font, header_align),
+        styled(ws_codes, "Codelist", header_fill, header_font, header_align),
+    ])
+    for field_name, codelist_name in FIELD_TO_CODELIST.items():
+        ws_codes.append([field_name, codelist_name])
+    ws_codes.append([])
+    ws_codes.append([styled(ws_codes, "How codes are resolved to text", font=title_font)])
+    ws_codes.append([styled(ws_codes, "Numeric codes (e.g. 005 in XML) and code names (e.g. license) are mapped to the labels below. ArcGIS often uses 3-digit numeric values.", alignment=note_align)])
+    ws_codes.append([])
+    ws_codes.append([
+        styled(ws_codes, "Codelist", header_fill, header_font, header_align),
+        styled(ws_codes, "Code (numeric or name)", header_fill, header_font, header_align),
+        styled(ws_codes, "Resolved label", header_fill, header_font, header_align),
+    ])
+    for codelist_name, code, label in get_codelist_resolution_table():
+        ws_codes.append([codelist_name, code, label])
 
     wb.save(output_file)
     print(f"\nExcel file created successfully: {output_file}")
     print(f"Total files processed: {len(all_data)}")
     print(f"Total unique attributes: {len(field_names)}")
-    compliant_count = sum(1 for r in compliance if r["Compliant"] == "Yes")
     print(f"ISO 19139 compliance: {compliant_count} compliant, {len(compliance) - compliant_count} with missing mandatory fields")
 
 
@@ -1592,10 +1714,27 @@ def parse_args():
         "input_folder",
         nargs="?",
         default="xml",
+        type=Path,
         help="Folder containing .xml metadata files (default: xml)",
     )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Suppress per-file progress lines (errors and summaries still print)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache extracted results here and reuse them for unchanged files "
+             "(keyed on file name, size and mtime)",
+    )
     args = parser.parse_args()
-    xml_folder = Path(args.input_folder)
+    xml_folder = args.input_folder
+    # Fail before any heavy work (or the reports dir is created) when the
+    # folder is wrong — typos surface instantly this way.
+    if not xml_folder.exists():
+        parser.error(f"XML folder not found at {xml_folder}")
     folder_name = xml_folder.name
     reports_dir = Path("reports")
     reports_dir.mkdir(parents=True, exist_ok=True)
@@ -1619,15 +1758,12 @@ def main():
     xml_folder = args.input_folder
     output_file = args.output_file
 
-    if not xml_folder.exists():
-        print(f"Error: XML folder not found at {xml_folder}")
-        return
-
     print(f"Processing XML files from: {xml_folder}")
     print("-" * 60)
 
     try:
-        all_data, field_names = process_all_xml_files(xml_folder)
+        all_data, field_names = process_all_xml_files(
+            xml_folder, quiet=args.quiet, cache_dir=args.cache_dir)
 
         if all_data is None:
             return